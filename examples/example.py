@@ -1,14 +1,17 @@
 #!/usr/bin/env python3
 """Example script demonstrating the RF GDS Library."""
 
-import os
 import sys
 import argparse
+from pathlib import Path
 
 import gdsfactory as gf
 
+# Directory containing this script
+HERE = Path(__file__).resolve().parent
+
 # Add the parent directory to the path to import rf_gds
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(str(HERE.parent))
 
 import rf_gds
 
@@ -20,8 +23,9 @@ def main():
     parser.add_argument("--output", type=str, default="output.gds", help="Output GDS file")
     args = parser.parse_args()
     
-    # Get the absolute path to the YAML file
-    yaml_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), args.yaml)
+    # Get the absolute paths to the YAML and output files
+    yaml_path = HERE / args.yaml
+    output_path = HERE / args.output
     
     print(f"Loading design from {yaml_path}...")
     
@@ -35,8 +39,7 @@ def main():
     gds = design.to_gds()
     
     # Save to file
-    output_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), args.output)
-    gds.write_gds(output_path)
+    gds.write_gds(str(output_path))
     
     print(f"GDS written to {output_path}")
     
@@ -1,38 +1,94 @@
 """
 make_em_macro.py — stub to generate a hard macro GDS for an EM structure (e.g., spiral inductor)
-Requires: gdstk or gdspy (install in your environment)
+Requires: gdstk or gdspy (install in your environment); numba is optional
+and speeds up spiral vertex generation
 """
 # pip install gdstk
 import math
 
+import numpy as np
+
 try:
     import gdstk
 except Exception as e:
     print("Install gdstk to run this script: pip install gdstk")
     raise
 
+
+def _spiral_points_numpy(turns, w, s, outer):
+    # Simple square spiral: segment k runs along (dx, dy)[k % 4] with length
+    # outer - (w + s) * (k // 2), so every vertex is known up front.
+    dx = np.array([1.0, 0.0, -1.0, 0.0])
+    dy = np.array([0.0, 1.0, 0.0, -1.0])
+    k = np.arange(turns*4)
+    idx = k % 4
+    L = outer - (w + s) * (k // 2)
+    pts = np.empty((turns*4 + 1, 2), dtype=np.float64)
+    pts[0] = 0.0
+    pts[1:, 0] = np.cumsum(dx[idx] * L)
+    pts[1:, 1] = np.cumsum(dy[idx] * L)
+    return pts
+
+
+try:
+    from numba import njit
+except ImportError:
+    _spiral_points = _spiral_points_numpy
+else:
+    # Same vertex schedule as _spiral_points_numpy, as an explicit loop that
+    # numba compiles once and caches on disk for parameter sweeps
+    @njit(cache=True)
+    def _spiral_points(turns, w, s, outer):
+        pts = np.empty((turns*4 + 1, 2), dtype=np.float64)
+        x = 0.0
+        y = 0.0
+        pts[0, 0] = x
+        pts[0, 1] = y
+        for k in range(turns*4):
+            L = outer - (w + s) * (k // 2)
+            d = k % 4
+            if d == 0:
+                x += L
+            elif d == 1:
+                y += L
+            elif d == 2:
+                x -= L
+            else:
+                y -= L
+            pts[k + 1, 0] = x
+            pts[k + 1, 1] = y
+        return pts
+
+
+def _manhattan_outline(pts, w):
+    # Outline of a width-w trace along a rectilinear centerline that turns
+    # by 90 degrees at every vertex. Segment k runs along (dx, dy)[k % 4], so
+    # its left normal is known without normalising; an inner vertex is offset
+    # by the sum of its two segment normals (the miter point), and the ends
+    # by the normal of their only segment.
+    nx = np.array([0.0, -1.0, 0.0, 1.0])
+    ny = np.array([1.0, 0.0, -1.0, 0.0])
+    idx = np.arange(len(pts) - 1) % 4
+    offset = np.zeros_like(pts)
+    offset[:-1, 0] += nx[idx]
+    offset[:-1, 1] += ny[idx]
+    offset[1:, 0] += nx[idx]
+    offset[1:, 1] += ny[idx]
+    offset *= 0.5 * w
+    return np.concatenate((pts + offset, (pts - offset)[::-1]))
+
+
 def spiral_inductor(cell_name="EM1", turns=3, w=5.0, s=5.0, outer=200.0, layer=6, datatype=0):
     lib = gdstk.Library()
     cell = lib.new_cell(cell_name)
-    # Simple square spiral
-    x = y = 0.0
-    L = outer
-    path = gdstk.FlexPath([(x, y)], w, layer=layer, datatype=datatype, bend_radius=0.0)
-    dir_seq = [(1,0), (0,1), (-1,0), (0,-1)]
-    step = 0
-    for t in range(turns*4):
-        dx, dy = dir_seq[t % 4]
-        path.segment((path.points[-1][0] + dx*L, path.points[-1][1] + dy*L))
-        step += 1
-        if step % 2 == 0:
-            L -= (w + s)
-    cell.add(path)
+    pts = _spiral_points(int(turns), float(w), float(s), float(outer))
+    cell.add(gdstk.Polygon(_manhattan_outline(pts, w), layer=layer, datatype=datatype))
     # Simple pins as squares at ends
     pin = gdstk.rectangle((-w, -w), (w, w), layer=layer, datatype=datatype)
     cell.add(pin)
     # add text labels "P1"/"P2" at approximate ends
     cell.add(gdstk.Label("P1", (0, 0), layer=layer))
-    cell.add(gdstk.Label("P2", (path.points[-1][0], path.points[-1][1]), layer=layer))
+    cell.add(gdstk.Label("P2", tuple(pts[-1]), layer=layer))
     return lib
 
 if __name__ == "__main__":
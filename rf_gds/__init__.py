@@ -1,28 +1,57 @@
 """RF GDS Library - Convert YAML descriptions of RF components to GDS files."""
 
+import importlib
+
 # Import core functionality
-from rf_gds.core import load_design, Design
+from rf_gds.core import load_design, load_design_from_dict, peek_design_header, Design
 
 # Import PDK functionality
 from rf_gds.pdk import PDK, register_pdk, get_pdk, GenericPDK
 
-# Import components to register them
-from rf_gds.components.transmission_lines import (
-    MicrostripLine, TaperedMicrostripLine, CurvedMicrostripLine,
-    CPWLine, CPWBend, CPWTaper
-)
-from rf_gds.components.passive import (
-    SpiralInductor, SymmetricInductor, SolenoidInductor,
-    MIMCapacitor, InterdigitatedCapacitor, ParallelPlateCapacitor
-)
-from rf_gds.components.basic_structures import (
-    WilkinsonDivider, BranchLineCoupler, RatRaceCoupler
-)
+# Components are imported on first attribute access (PEP 562) so that
+# importing the package, e.g. for the CLI, does not load every component module
+_LAZY = {
+    # Transmission Lines
+    "MicrostripLine": "rf_gds.components.transmission_lines",
+    "TaperedMicrostripLine": "rf_gds.components.transmission_lines",
+    "CurvedMicrostripLine": "rf_gds.components.transmission_lines",
+    "CPWLine": "rf_gds.components.transmission_lines",
+    "CPWBend": "rf_gds.components.transmission_lines",
+    "CPWTaper": "rf_gds.components.transmission_lines",
+    
+    # Passive Components
+    "SpiralInductor": "rf_gds.components.passive",
+    "SymmetricInductor": "rf_gds.components.passive",
+    "SolenoidInductor": "rf_gds.components.passive",
+    "MIMCapacitor": "rf_gds.components.passive",
+    "InterdigitatedCapacitor": "rf_gds.components.passive",
+    "ParallelPlateCapacitor": "rf_gds.components.passive",
+    
+    # Basic Structures
+    "WilkinsonDivider": "rf_gds.components.basic_structures",
+    "BranchLineCoupler": "rf_gds.components.basic_structures",
+    "RatRaceCoupler": "rf_gds.components.basic_structures",
+}
+
+
+def __getattr__(name):
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return list(globals()) + list(_LAZY)
+
 
 __version__ = "0.1.0"
 __all__ = [
     # Core
-    "load_design", "Design",
+    "load_design", "load_design_from_dict", "peek_design_header", "Design",
     
     # PDK
     "PDK", "register_pdk", "get_pdk", "GenericPDK",
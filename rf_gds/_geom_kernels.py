@@ -0,0 +1,309 @@
+"""Numeric geometry kernels for RF GDS Library components.
+
+The kernels are written in the subset of NumPy that numba can compile, and
+are provided by the first available of:
+
+1. ``rf_gds._geom_kernels_aot``, an extension module compiled ahead of time
+   with numba's ``pycc`` by running ``python -m rf_gds._geom_kernels``, so
+   there is no JIT warmup in one-shot CLI runs. The build is opt-in and not
+   part of the package install: ``numba.pycc`` is deprecated and will be
+   removed from numba, and the extension has to be rebuilt for every numba
+   and NumPy version;
+2. numba ``njit(cache=True)`` versions, compiled on first use and cached
+   on disk, if the ``RF_GDS_NUMBA`` environment variable is set to ``1``.
+   This is opt-in since importing numba and loading the cached kernels
+   takes longer than the geometry of a typical design, and is paid again
+   in every ``--jobs`` worker;
+3. the plain NumPy functions below, by default.
+
+Angle tables shared by all arc-based components come from ``unit_arc``, and
+batches of axis-aligned rectangles from ``rects``.
+
+Vertex arrays are C-contiguous float64, the layout gdstk stores polygons
+in, so they are taken over without a conversion. Narrower types do not pay
+off: float32 input is converted back with an extra copy, and cannot resolve
+the 1 nm grid a few millimetres away from the origin.
+"""
+
+import functools
+import math
+import os
+
+import numpy as np
+
+# Name of the ahead-of-time compiled extension module
+AOT_MODULE = "_geom_kernels_aot"
+
+# Environment variable enabling the numba JIT kernels
+NUMBA_ENV_VAR = "RF_GDS_NUMBA"
+
+# Numba signatures of the exported kernels
+_SIGNATURES = {
+    "arc_ring": "f8[:,:](f8, f8, f8[:], f8[:])",
+    "rat_race_extensions": "f8[:,:,:](f8, f8, f8, f8[:])",
+    "interdigitated_fingers": "f8[:,:,:](i8, f8, f8, f8, f8)",
+    "spiral_xy": "f8[:,:](f8, f8, f8, i8)",
+}
+
+
+def _arc_ring(inner_radius, outer_radius, c, s):
+    # Inner edge along the unit arc (c, s), then the outer edge back again
+    n_points = c.shape[0]
+    points = np.empty((2 * n_points, 2), dtype=np.float64)
+    points[:n_points, 0] = inner_radius * c
+    points[:n_points, 1] = inner_radius * s
+    points[n_points:, 0] = outer_radius * c[::-1]
+    points[n_points:, 1] = outer_radius * s[::-1]
+    return points
+
+
+def _rat_race_extensions(radius, width, extension_length, angles):
+    # Each extension is a rectangle starting on the ring centreline and
+    # running outwards along (dx, dy), offset by half the width along the
+    # normal (-dy, dx).
+    dx = np.cos(angles)
+    dy = np.sin(angles)
+    x = radius * dx
+    y = radius * dy
+    hw = width / 2
+    
+    polys = np.empty((angles.shape[0], 4, 2), dtype=np.float64)
+    polys[:, 0, 0] = x - hw * dy
+    polys[:, 0, 1] = y + hw * dx
+    polys[:, 1, 0] = x + extension_length * dx - hw * dy
+    polys[:, 1, 1] = y + extension_length * dy + hw * dx
+    polys[:, 2, 0] = x + extension_length * dx + hw * dy
+    polys[:, 2, 1] = y + extension_length * dy - hw * dx
+    polys[:, 3, 0] = x + hw * dy
+    polys[:, 3, 1] = y - hw * dx
+    return polys
+
+
+def _interdigitated_fingers(n_fingers, y0, pitch, finger_length, finger_width):
+    # Every finger spans x = 0 .. finger_length; finger i starts at
+    # y0 + i * pitch
+    y = y0 + np.arange(n_fingers) * pitch
+    
+    fingers = np.empty((n_fingers, 4, 2), dtype=np.float64)
+    fingers[:, 0, 0] = 0.0
+    fingers[:, 1, 0] = finger_length
+    fingers[:, 2, 0] = finger_length
+    fingers[:, 3, 0] = 0.0
+    fingers[:, 0, 1] = y
+    fingers[:, 1, 1] = y
+    fingers[:, 2, 1] = y + finger_width
+    fingers[:, 3, 1] = y + finger_width
+    return fingers
+
+
+def _spiral_xy(inner_radius, spacing, theta_end, n_points):
+    # Archimedean spiral r = inner_radius + spacing * theta / (2 * pi), at
+    # uniform steps of theta from 0 to theta_end (as np.linspace spaces them)
+    theta = np.arange(n_points) * (theta_end / (n_points - 1))
+    theta[-1] = theta_end
+    radius = inner_radius + spacing * theta / (2 * np.pi)
+    
+    points = np.empty((n_points, 2), dtype=np.float64)
+    points[:, 0] = radius * np.cos(theta)
+    points[:, 1] = radius * np.sin(theta)
+    return points
+
+
+_KERNELS = {
+    "arc_ring": _arc_ring,
+    "rat_race_extensions": _rat_race_extensions,
+    "interdigitated_fingers": _interdigitated_fingers,
+    "spiral_xy": _spiral_xy,
+}
+
+
+def build_cc():
+    """Create the numba ``CC`` object for the ahead-of-time extension.
+    
+    Returns:
+        A ``numba.pycc.CC`` exporting every kernel, writing its output next
+        to this file
+    
+    Raises:
+        ImportError: If numba is not installed
+    """
+    from numba.pycc import CC
+    
+    cc = CC(AOT_MODULE)
+    cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+    for name, func in _KERNELS.items():
+        cc.export(name, _SIGNATURES[name])(func)
+    return cc
+
+
+def _numba_njit():
+    """Get numba's njit decorator, if the JIT kernels are enabled.
+    
+    Returns:
+        ``numba.njit``, or None if the kernels are not enabled or numba is
+        not installed
+    """
+    if os.environ.get(NUMBA_ENV_VAR) != "1":
+        return None
+    try:
+        from numba import njit
+    except ImportError:
+        return None
+    return njit
+
+
+try:
+    from rf_gds import _geom_kernels_aot as _backend
+except ImportError:
+    _njit = _numba_njit()
+    if _njit is None:
+        BACKEND = "numpy"
+        arc_ring = _arc_ring
+        rat_race_extensions = _rat_race_extensions
+        interdigitated_fingers = _interdigitated_fingers
+        spiral_xy = _spiral_xy
+    else:
+        BACKEND = "numba"
+        arc_ring = _njit(cache=True)(_arc_ring)
+        rat_race_extensions = _njit(cache=True)(_rat_race_extensions)
+        interdigitated_fingers = _njit(cache=True)(_interdigitated_fingers)
+        spiral_xy = _njit(cache=True)(_spiral_xy)
+else:
+    BACKEND = "aot"
+    arc_ring = _backend.arc_ring
+    rat_race_extensions = _backend.rat_race_extensions
+    interdigitated_fingers = _backend.interdigitated_fingers
+    spiral_xy = _backend.spiral_xy
+
+
+@functools.lru_cache(maxsize=128)
+def unit_arc(theta0: float, theta1: float, n_points: int):
+    """Get the cos/sin table of an arc on the unit circle.
+    
+    The tables are shared between all callers with the same angles, so the
+    returned arrays are read-only.
+    
+    Args:
+        theta0: Start angle in radians
+        theta1: End angle in radians
+        n_points: Number of points, including both ends
+        
+    Returns:
+        A tuple (cos, sin) of read-only float64 arrays
+    """
+    # Uniform steps as np.linspace takes them, without its argument handling
+    theta = np.arange(n_points) * ((theta1 - theta0) / (n_points - 1)) + theta0
+    theta[-1] = theta1
+    c = np.cos(theta)
+    s = np.sin(theta)
+    c.setflags(write=False)
+    s.setflags(write=False)
+    return c, s
+
+
+def arc_point_count(radius: float, angle: float, tolerance: float, min_points: int = 8) -> int:
+    """Get the number of points needed to tessellate an arc.
+    
+    Points are spaced so that no chord deviates from the arc by more than
+    ``tolerance`` (the chord sagitta), so the count grows with the radius
+    instead of being fixed.
+    
+    Args:
+        radius: Radius of the arc; use the outermost edge, where the chord
+            error is largest
+        angle: Angle of the arc in degrees
+        tolerance: Maximum distance between a chord and the arc
+        min_points: Lower bound on the number of points
+        
+    Returns:
+        The number of points, including both ends
+    """
+    if tolerance <= 0:
+        raise ValueError(f"arc tolerance must be positive, got {tolerance}")
+    if tolerance >= radius:
+        return min_points
+    step = 2 * math.acos(1 - tolerance / radius)
+    return max(min_points, math.ceil(math.radians(abs(angle)) / step) + 1)
+
+
+def spiral_point_count(inner_radius: float, spacing: float, n_turns: float,
+                       tolerance: float, min_points: int = 8) -> int:
+    """Get the number of points needed to tessellate an Archimedean spiral.
+    
+    The spiral r = inner_radius + spacing * theta / (2 * pi) is sampled at
+    uniform angle steps. At a fixed step, the chord error grows with the
+    radius, so the step is sized from the sagitta of the osculating circle
+    at both ends of the spiral, and the smaller one is used. Near a small
+    inner radius the curvature radius can be below the tolerance; any step
+    up to a half turn of the tangent is then within it.
+    
+    Args:
+        inner_radius: Radius at the start of the spiral
+        spacing: Radial pitch per turn
+        n_turns: Number of turns (can be fractional)
+        tolerance: Maximum distance between a chord and the spiral
+        min_points: Lower bound on the number of points
+        
+    Returns:
+        The number of points, including both ends
+        
+    Raises:
+        ValueError: If the tolerance is not positive
+    """
+    if tolerance <= 0:
+        raise ValueError(f"arc tolerance must be positive, got {tolerance}")
+    a = inner_radius
+    b = spacing / (2 * math.pi)
+    theta = 2 * math.pi * n_turns
+    if not (a or b):
+        return min_points
+    
+    def step(r):
+        # Angle step whose chord has a sagitta of tolerance at radius r
+        h2 = r * r + b * b
+        curvature_radius = h2 ** 1.5 / (h2 + b * b)
+        if tolerance >= curvature_radius:
+            turn = math.pi
+        else:
+            turn = 2 * math.acos(1 - tolerance / curvature_radius)
+        # The tangent turns by (r^2 + 2 b^2) / (r^2 + b^2) per unit of theta
+        return turn * h2 / (h2 + b * b)
+    
+    dtheta = min(step(a), step(a + b * abs(theta)))
+    return max(min_points, math.ceil(abs(theta) / dtheta) + 1)
+
+
+def rects(x0, y0, x1, y1) -> np.ndarray:
+    """Get the vertices of a batch of axis-aligned rectangles.
+    
+    The edges are broadcast against each other, so any of them can be a
+    scalar shared by all rectangles.
+    
+    Args:
+        x0: Left edges
+        y0: Bottom edges
+        x1: Right edges
+        y1: Top edges
+        
+    Returns:
+        An (n, 4, 2) float64 array with the corners of each rectangle,
+        counter-clockwise from (x0, y0)
+    """
+    x0, y0, x1, y1 = np.broadcast_arrays(
+        np.asarray(x0, dtype=np.float64), np.asarray(y0, dtype=np.float64),
+        np.asarray(x1, dtype=np.float64), np.asarray(y1, dtype=np.float64),
+    )
+    polys = np.empty(x0.shape + (4, 2), dtype=np.float64)
+    polys[..., 0, 0] = x0
+    polys[..., 0, 1] = y0
+    polys[..., 1, 0] = x1
+    polys[..., 1, 1] = y0
+    polys[..., 2, 0] = x1
+    polys[..., 2, 1] = y1
+    polys[..., 3, 0] = x0
+    polys[..., 3, 1] = y1
+    return polys
+
+
+if __name__ == "__main__":
+    build_cc().compile()
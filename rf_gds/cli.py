@@ -3,9 +3,17 @@
 
 import os
 import sys
+import gzip
+import shutil
 import argparse
+import tempfile
+import multiprocessing
 
 import rf_gds
+from rf_gds.core import read_yaml
+
+# Default write buffer for compressed GDS output (64 MiB)
+DEFAULT_BUFFER_SIZE = 64 * 1024 * 1024
 
 
 def main():
@@ -17,6 +25,18 @@ def main():
     convert_parser = subparsers.add_parser("convert", help="Convert YAML to GDS")
     convert_parser.add_argument("yaml_file", help="YAML file to convert")
     convert_parser.add_argument("--output", "-o", help="Output GDS file")
+    convert_parser.add_argument("--cache-dir", default=None,
+                                help="Directory for cached component GDS files "
+                                     "(e.g. ~/.cache/rf_gds); off by default")
+    convert_parser.add_argument("--no-cache", action="store_true",
+                                help="Rebuild every component even if --cache-dir is given")
+    convert_parser.add_argument("--buffer-size", type=int, default=DEFAULT_BUFFER_SIZE,
+                                help="Chunk size in bytes for compressing .gds.gz output; "
+                                     "plain .gds output ignores it")
+    convert_parser.add_argument("--jobs", "-j", type=int, default=1,
+                                help="Number of processes used to build components")
+    convert_parser.add_argument("--validate", action="store_true",
+                                help="Validate the YAML file before converting it")
     
     # Validate command
     validate_parser = subparsers.add_parser("validate", help="Validate YAML file")
@@ -26,30 +46,45 @@ def main():
     args = parser.parse_args()
     
     if args.command == "convert":
-        convert_yaml_to_gds(args.yaml_file, args.output)
+        cache_dir = None if args.no_cache else args.cache_dir
+        convert_yaml_to_gds(args.yaml_file, args.output, cache_dir=cache_dir,
+                            buffer_size=args.buffer_size, jobs=args.jobs,
+                            validate=args.validate)
     elif args.command == "validate":
         validate_yaml(args.yaml_file)
     else:
         parser.print_help()
 
 
-def convert_yaml_to_gds(yaml_file, output_file=None):
+def convert_yaml_to_gds(yaml_file, output_file=None, cache_dir=None,
+                        buffer_size=DEFAULT_BUFFER_SIZE, jobs=1, validate=False):
     """Convert a YAML file to GDS.
     
     Args:
         yaml_file: Path to the YAML file
-        output_file: Path to the output GDS file
+        output_file: Path to the output GDS file, gzip-compressed if it
+            ends with ``.gds.gz``
+        cache_dir: Optional directory for cached component GDS files
+        buffer_size: Write buffer size in bytes for compressed output
+        jobs: Number of worker processes used to build the components
+        validate: Whether to reject YAML data that fails the schema check
+            instead of converting it with defaults for missing fields
     """
     try:
-        # Load the design
-        design = rf_gds.load_design(yaml_file)
+        # Load the design; an unknown PDK fails before the components are parsed
+        if validate:
+            # Strict parsing checks the schema itself and raises on errors
+            design = rf_gds.load_design_from_dict(load_yaml(yaml_file), strict=True)
+        else:
+            design = rf_gds.load_design(yaml_file)
         
         # Set default output file if not provided
         if output_file is None:
             output_file = os.path.splitext(yaml_file)[0] + ".gds"
         
         # Convert to GDS
-        gds = design.to_gds(output_file)
+        gds = design.to_gds(cache_dir=cache_dir, jobs=jobs)
+        write_gds(gds, output_file, buffer_size=buffer_size)
         
         print(f"Converted {yaml_file} to {output_file}")
         
@@ -58,6 +93,95 @@ def convert_yaml_to_gds(yaml_file, output_file=None):
         sys.exit(1)
 
 
+def write_gds(gds, output_file, buffer_size=DEFAULT_BUFFER_SIZE):
+    """Write a GDS component to a file.
+    
+    Files ending with ``.gds.gz`` are compressed at zlib level 1, which is
+    about twice as fast as the default level, in chunks of ``buffer_size``
+    bytes. gdstk only writes to paths, so the GDS is written into a named
+    pipe and compressed by a child process while it is written; without
+    named pipes (Windows), it is written to a temporary file first. Plain
+    ``.gds`` files are written by gdstk directly and ignore
+    ``buffer_size``.
+    
+    Args:
+        gds: The gdsfactory Component to write
+        output_file: Path to the output GDS file
+        buffer_size: Chunk size in bytes for compressed output
+        
+    Raises:
+        RuntimeError: If compressing the output failed
+    """
+    # Same-named cells were checked to be identical by Design.to_gds, so
+    # keep one copy of each without warning
+    if not str(output_file).endswith(".gds.gz"):
+        gds.write_gds(output_file, on_duplicate_cell="overwrite")
+        return
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        gds_path = os.path.join(tmp_dir, "design.gds")
+        if not hasattr(os, "mkfifo"):
+            gds.write_gds(gds_path, on_duplicate_cell="overwrite")
+            compress_gds(gds_path, output_file, buffer_size)
+            return
+        
+        # The compressor is a process, not a thread, since gdstk holds the
+        # GIL while it writes; it is started before gdstk blocks on opening
+        # the pipe
+        os.mkfifo(gds_path)
+        compressor = multiprocessing.Process(
+            target=compress_gds, args=(gds_path, output_file, buffer_size)
+        )
+        compressor.start()
+        try:
+            gds.write_gds(gds_path, on_duplicate_cell="overwrite")
+        except BaseException:
+            # The compressor may be waiting for a writer that never came
+            compressor.terminate()
+            raise
+        finally:
+            compressor.join()
+    
+    if compressor.exitcode != 0:
+        raise RuntimeError(f"Compressing {output_file} failed with exit code {compressor.exitcode}")
+
+
+def compress_gds(gds_path, output_file, buffer_size=DEFAULT_BUFFER_SIZE):
+    """Compress a GDS file, or a named pipe it is written into, with gzip.
+    
+    Args:
+        gds_path: Path to the GDS file or named pipe
+        output_file: Path to the output ``.gds.gz`` file
+        buffer_size: Chunk size in bytes
+    """
+    with open(gds_path, "rb") as src, gzip.open(output_file, "wb", compresslevel=1) as dst:
+        shutil.copyfileobj(src, dst, buffer_size)
+
+
+def load_yaml(yaml_file):
+    """Load a YAML file.
+    
+    Args:
+        yaml_file: Path to the YAML file
+        
+    Returns:
+        The YAML data as a dictionary
+    """
+    return read_yaml(yaml_file)
+
+
+def print_validation_errors(yaml_file, errors):
+    """Print the validation errors for a YAML file.
+    
+    Args:
+        yaml_file: Path to the YAML file
+        errors: The validation errors
+    """
+    print(f"Validation failed for {yaml_file}:")
+    for error in errors:
+        print(f"  - {error}")
+
+
 def validate_yaml(yaml_file):
     """Validate a YAML file.
     
@@ -65,20 +189,16 @@ def validate_yaml(yaml_file):
         yaml_file: Path to the YAML file
     """
     try:
-        import yaml
         from rf_gds.yaml_parser import validate_yaml_schema
         
         # Load the YAML file
-        with open(yaml_file, "r") as f:
-            yaml_data = yaml.safe_load(f)
+        yaml_data = load_yaml(yaml_file)
         
         # Validate the schema
         errors = validate_yaml_schema(yaml_data)
         
         if errors:
-            print(f"Validation failed for {yaml_file}:")
-            for error in errors:
-                print(f"  - {error}")
+            print_validation_errors(yaml_file, errors)
             sys.exit(1)
         else:
             print(f"Validation successful for {yaml_file}")
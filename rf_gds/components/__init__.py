@@ -1,3 +1,3 @@
 """RF GDS Component Library."""
 
-from rf_gds.components.base import Component, Port, Connection
+from rf_gds.components.base import Component, Port, Connection, clear_cell_cache
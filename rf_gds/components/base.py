@@ -1,28 +1,178 @@
 """Base component classes for RF GDS Library."""
 
-from typing import Dict, List, Tuple, Optional, Any, Type, ClassVar, Union
+from typing import TYPE_CHECKING, Dict, List, Tuple, Optional, Any, Type, ClassVar, Union, Callable
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+import functools
+import hashlib
+import importlib
+import inspect
 
-import gdsfactory as gf
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+if TYPE_CHECKING:
+    # gdsfactory is slow to import, so it is only imported at runtime by the
+    # functions that build geometry
+    import gdsfactory as gf
 
 # Forward reference for PDK
 PDK = Any
 
+# Registry of component classes, filled by Component.__pydantic_init_subclass__
+_component_registry: Dict[str, Type["Component"]] = {}
+
+# Packages defining the built-in component types. They are imported on the
+# first registry miss, since the top-level package no longer imports them.
+_BUILTIN_COMPONENT_PACKAGES = (
+    "rf_gds.components.transmission_lines",
+    "rf_gds.components.passive",
+    "rf_gds.components.basic_structures",
+)
+_builtins_loaded = False
+
+# Shared (layer, datatype) tuples, so that ports on the same layer reference
+# one tuple instead of each holding its own copy
+_LAYER_CACHE: Dict[Tuple[int, int], Tuple[int, int]] = {}
+
+# Shared position for ports placed at the component origin
+_ORIGIN: Tuple[float, float] = (0.0, 0.0)
+
+# Geometry cells built by to_gds() methods decorated with cached_cell, keyed
+# by component class, PDK and geometry parameters, together with the ports
+# registered while building them. The least recently used cells are dropped
+# beyond CELL_CACHE_SIZE entries.
+_CELL_CACHE: "OrderedDict[Tuple[Any, ...], Tuple[gf.Component, Dict[str, Port]]]" = OrderedDict()
+CELL_CACHE_SIZE = 1024
+
+# Version of the geometry built by the to_gds() methods. It is part of the
+# key of the on-disk GDS cache (see rf_gds.core), so bump it whenever a
+# builder changes the polygons or ports it produces.
+GEOMETRY_VERSION = 2
+
+# Component fields that do not affect the geometry built by to_gds()
+_NON_GEOMETRY_FIELDS = {"name", "position", "rotation", "ports", "connections"}
+
+
+def _port_position(position: Tuple[float, float]) -> Tuple[float, float]:
+    """Convert a port position to floats, as Port validation would.
+    
+    Args:
+        position: The position (x, y), as a tuple, list or array
+        
+    Returns:
+        The position as a tuple of floats; the shared origin tuple for (0, 0)
+    """
+    position = (float(position[0]), float(position[1]))
+    return _ORIGIN if position == _ORIGIN else position
+
+
+def _intern_layer(layer: Tuple[int, int]) -> Tuple[int, int]:
+    """Return the shared tuple for a (layer, datatype) pair.
+    
+    Args:
+        layer: The layer as a tuple or list (layer, datatype)
+        
+    Returns:
+        The interned tuple; layer names are returned unchanged
+    """
+    if isinstance(layer, str):
+        return layer
+    layer = tuple(layer)
+    return _LAYER_CACHE.setdefault(layer, layer)
+
+
+def _pdk_key(pdk: Optional[PDK]) -> Optional[Tuple[Any, ...]]:
+    """Get a hashable key identifying a PDK and its layer table.
+    
+    Two PDKs with the same name but different layers get different keys, so
+    geometry cached for one is not reused for the other.
+    
+    Args:
+        pdk: The PDK, or None
+        
+    Returns:
+        A tuple of the PDK name and its sorted (name, (layer, datatype))
+        pairs, or None without a PDK
+    """
+    if pdk is None:
+        return None
+    layers = tuple(sorted((name, layer.as_tuple()) for name, layer in pdk.layers.items()))
+    return (pdk.name, layers)
+
+
+def clear_cell_cache() -> None:
+    """Drop all geometry cells shared by cached_cell.
+    
+    gf.clear_cache() does not reset this cache; call both to start from an
+    empty state, e.g. between tests.
+    """
+    _CELL_CACHE.clear()
+
+
+def cached_cell(to_gds: Callable[["Component"], "gf.Component"]) -> Callable[["Component"], "gf.Component"]:
+    """Share the geometry built by a to_gds() method between equal components.
+    
+    Components of the same class with the same geometry parameters and PDK
+    (name and layer table) build their geometry once. The wrapped method builds it into an unnamed
+    gdsfactory Component, which is then named after a hash of those
+    parameters. Each call returns a new Component named after the component,
+    holding a reference to the shared cell and copies of its ports, so the
+    returned Component may be modified but the cell it references may not.
+    
+    Args:
+        to_gds: The to_gds() method to wrap
+        
+    Returns:
+        The wrapped to_gds() method
+    """
+    @functools.wraps(to_gds)
+    def wrapper(self: "Component") -> "gf.Component":
+        import gdsfactory as gf
+        
+        pdk = _pdk_key(self._pdk)
+        params = self.model_dump_json(exclude=_NON_GEOMETRY_FIELDS)
+        key = (type(self), pdk, params)
+        try:
+            cell, ports = _CELL_CACHE[key]
+        except KeyError:
+            cell = to_gds(self)
+            digest = hashlib.blake2b(f"{pdk}:{params}".encode(), digest_size=8).hexdigest()
+            cell.name = f"{self.type}_{digest}"
+            ports = dict(self.ports)
+            _CELL_CACHE[key] = (cell, ports)
+            if len(_CELL_CACHE) > CELL_CACHE_SIZE:
+                _CELL_CACHE.popitem(last=False)
+        else:
+            _CELL_CACHE.move_to_end(key)
+            # Restore the ports that to_gds() would have registered
+            self.ports.update(ports)
+        
+        component = gf.Component(name=self.name)
+        ref = component.add_ref(cell)
+        component.add_ports(ref.ports)
+        return component
+    return wrapper
+
 
 class Port(BaseModel):
     """Represents a port on a component."""
 
+    # Ports are write-once leaf records; freezing them keeps validation to
+    # construction time only.
+    model_config = ConfigDict(frozen=True)
+
     name: str
     position: Tuple[float, float]
     width: float
-    layer: Tuple[int, int]
+    layer: Union[Tuple[int, int], str]  # (layer, datatype) or a PDK layer name
     orientation: float = 0  # in degrees
 
 
 class Connection(BaseModel):
     """Represents a connection between two ports."""
 
+    model_config = ConfigDict(frozen=True)
+
     port: str
     target: str
     target_port: str
@@ -31,6 +181,8 @@ class Connection(BaseModel):
 class Component(BaseModel, ABC):
     """Base class for all RF components."""
 
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
     name: str
     type: ClassVar[str]
     parameters: Dict[str, Any] = Field(default_factory=dict)
@@ -39,6 +191,16 @@ class Component(BaseModel, ABC):
     ports: Dict[str, Port] = Field(default_factory=dict)
     connections: List[Connection] = Field(default_factory=list)
     _pdk: Optional[PDK] = None
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        """Register concrete subclasses that declare their own ``type``."""
+        super().__pydantic_init_subclass__(**kwargs)
+        component_type = cls.__dict__.get("type")
+        if isinstance(component_type, str) and not inspect.isabstract(cls):
+            _component_registry[component_type] = cls
+            # A new class may replace a type looked up before
+            get_component_class.cache_clear()
     
     def add_port(self, name: str, position: Tuple[float, float], width: float, 
                  layer: Tuple[int, int], orientation: float = 0) -> None:
@@ -51,14 +213,93 @@ class Component(BaseModel, ABC):
             layer: Port layer (layer, datatype)
             orientation: Port orientation in degrees
         """
-        self.ports[name] = Port(
+        # Ports are computed by to_gds() from already validated geometry, so
+        # construct them without re-running the field validators, with the
+        # values converted as those would
+        self.ports[name] = Port.model_construct(
+            name=name,
+            position=_port_position(position),
+            width=float(width),
+            layer=_intern_layer(layer),
+            orientation=float(orientation),
+        )
+    
+    def _register_port(self, component: "gf.Component", name: str, center: Tuple[float, float],
+                       width: float, orientation: float, layer: Tuple[int, int],
+                       model_layer: Optional[Union[Tuple[int, int], str]] = None) -> None:
+        """Add a port to both a generated GDS component and this component.
+        
+        Args:
+            component: The gdsfactory Component being built by to_gds()
+            name: Port name
+            center: Port position (x, y)
+            width: Port width
+            orientation: Port orientation in degrees
+            layer: Port layer (layer, datatype) drawn in the GDS component
+            model_layer: Layer recorded on this component's port, if it
+                differs from ``layer``, e.g. the PDK layer name the user gave
+        """
+        component.add_port(
             name=name,
-            position=position,
+            center=center,
             width=width,
-            layer=layer,
             orientation=orientation,
+            layer=layer,
+        )
+        # Internal fast path: the arguments come straight from to_gds()
+        # geometry, so skip the public add_port() wrapper as well as the
+        # Port validators
+        self.ports[name] = Port.model_construct(
+            name=name,
+            position=_port_position(center),
+            width=float(width),
+            layer=_intern_layer(layer if model_layer is None else model_layer),
+            orientation=float(orientation),
         )
     
+    def _add_rectangle(self, component: "gf.Component", x0: float, y0: float,
+                       x1: float, y1: float, layer: Tuple[int, int]) -> "gf.ComponentReference":
+        """Add an axis-aligned rectangle to a generated GDS component.
+        
+        The rectangle is a reference to a gdsfactory rectangle cell. Those
+        cells are cached by size and layer, so every rectangle with the same
+        size and layer in a layout shares one cell definition.
+        
+        Args:
+            component: The gdsfactory Component being built by to_gds()
+            x0: Left edge
+            y0: Bottom edge
+            x1: Right edge
+            y1: Top edge
+            layer: Layer (layer, datatype)
+            
+        Returns:
+            The reference to the rectangle cell
+        """
+        import gdsfactory as gf
+        
+        cell = gf.components.rectangle(size=(x1 - x0, y1 - y0), layer=layer, port_type=None)
+        return component.add_ref(cell, origin=(x0, y0))
+    
+    def _add_path(self, component: "gf.Component", points: Any, width: float,
+                  layer: Tuple[int, int]) -> None:
+        """Add a constant-width path to a generated GDS component.
+        
+        gdsfactory Components have no add_path(), so the points are extruded
+        as a gdsfactory path and the resulting polygons are added directly.
+        
+        Args:
+            component: The gdsfactory Component being built by to_gds()
+            points: The path centerline as an (N, 2) array or a list of (x, y)
+            width: Width of the path
+            layer: Layer (layer, datatype)
+        """
+        import gdsfactory as gf
+        
+        extruded = gf.Path(points).extrude(width=width, layer=layer)
+        for polygon in extruded.get_polygons():
+            component.add_polygon(polygon, layer=layer)
+    
     def add_connection(self, port: str, target: str, target_port: str) -> None:
         """Add a connection to another component.
         
@@ -92,20 +333,19 @@ class Component(BaseModel, ABC):
             ValueError: If the PDK is not set
             KeyError: If the layer is not found in the PDK
         """
-        if self._pdk is None:
-            # If no PDK is set, return the layer as a tuple if it's a tuple or list
-            if isinstance(layer_name, (tuple, list)) and len(layer_name) == 2:
-                return (layer_name[0], layer_name[1])
-            raise ValueError(f"No PDK set for component {self.name}")
-        
-        # If the layer_name is already a tuple, return it as is
+        # If the layer_name is already a tuple, return it as is, with or
+        # without a PDK (exact type check: the common case of every call)
+        if type(layer_name) is tuple and len(layer_name) == 2:
+            return layer_name
         if isinstance(layer_name, (tuple, list)) and len(layer_name) == 2:
             return (layer_name[0], layer_name[1])
-            
+        
+        if self._pdk is None:
+            raise ValueError(f"No PDK set for component {self.name}")
         return self._pdk.get_layer(layer_name)
     
     @abstractmethod
-    def to_gds(self) -> gf.Component:
+    def to_gds(self) -> "gf.Component":
         """Convert the component to a GDS component.
         
         Returns:
@@ -114,68 +354,57 @@ class Component(BaseModel, ABC):
         pass
 
 
-class TransmissionLine(Component, ABC):
-    """Base class for transmission line components."""
+class TransmissionLine(Component):
+    """Base class for transmission line components.
+    
+    The dimensions differ between line types, e.g. tapers have an input
+    and an output width and bends have no length, so each subclass
+    declares its own.
+    """
 
     type: ClassVar[str] = "transmission_line"
-    length: float
-    width: float
-    
-    @abstractmethod
-    def to_gds(self) -> gf.Component:
-        pass
 
 
-class PassiveComponent(Component, ABC):
+class PassiveComponent(Component):
     """Base class for passive components."""
 
     type: ClassVar[str] = "passive"
-    
-    @abstractmethod
-    def to_gds(self) -> gf.Component:
-        pass
 
 
-class BasicStructure(Component, ABC):
+class BasicStructure(Component):
     """Base class for basic RF structures."""
 
     type: ClassVar[str] = "basic_structure"
-    
-    @abstractmethod
-    def to_gds(self) -> gf.Component:
-        pass
 
 
-class AdvancedStructure(Component, ABC):
+class AdvancedStructure(Component):
     """Base class for advanced RF structures."""
 
     type: ClassVar[str] = "advanced_structure"
-    
-    @abstractmethod
-    def to_gds(self) -> gf.Component:
-        pass
-
-
-# Registry of component classes
-_component_registry: Dict[str, Type[Component]] = {}
 
 
 def register_component(cls: Type[Component]) -> Type[Component]:
     """Register a component class.
     
+    Concrete subclasses of ``Component`` are registered automatically when
+    they are defined, so this decorator is kept only for backward
+    compatibility and returns the class unchanged.
+    
     Args:
         cls: The component class to register
         
     Returns:
         The component class
     """
-    _component_registry[cls.type] = cls
     return cls
 
 
+@functools.lru_cache(maxsize=None)
 def get_component_class(component_type: str) -> Type[Component]:
     """Get a component class by type.
     
+    Lookups are cached; registering a component class clears the cache.
+    
     Args:
         component_type: The component type
         
@@ -185,6 +414,15 @@ def get_component_class(component_type: str) -> Type[Component]:
     Raises:
         ValueError: If the component type is not registered
     """
-    if component_type not in _component_registry:
-        raise ValueError(f"Unknown component type: {component_type}")
-    return _component_registry[component_type]
+    global _builtins_loaded
+    try:
+        return _component_registry[component_type]
+    except KeyError:
+        if _builtins_loaded:
+            raise ValueError(f"Unknown component type: {component_type}") from None
+    
+    # Import the built-in component packages once so that they register
+    for package in _BUILTIN_COMPONENT_PACKAGES:
+        importlib.import_module(package)
+    _builtins_loaded = True
+    return get_component_class(component_type)
@@ -6,10 +6,42 @@ import math
 import gdsfactory as gf
 import numpy as np
 
-from rf_gds.components.base import BasicStructure, register_component
+from rf_gds import _geom_kernels
+from rf_gds.components.base import BasicStructure, cached_cell
+
+
+@gf.cell
+def _arc_section(radius: float, width: float, angle: float,
+                 layer: Tuple[int, int], n_points: int) -> gf.Component:
+    """Get an arc of transmission line as a cached cell.
+    
+    The arc is a gdsfactory path extruded with the line width. It starts at
+    the origin heading east and bends counter-clockwise about (0, radius).
+    gf.cell caches the cell by its arguments, so every arc with the same
+    geometry in a layout shares one cell definition.
+    
+    Args:
+        radius: Radius of the arc centerline
+        width: Width of the line
+        angle: Angle of the arc in degrees
+        layer: Layer (layer, datatype)
+        n_points: Number of points along the arc
+        
+    Returns:
+        A gdsfactory Component holding the arc
+    """
+    path = gf.path.arc(radius=radius, angle=angle, npoints=n_points)
+    return path.extrude(gf.cross_section.cross_section(width=width, layer=layer))
+
+
+# Port directions of the rat-race coupler (0°, 90°, 180° and 270°)
+_RAT_RACE_PORT_ANGLES = np.array([0, np.pi/2, np.pi, 3*np.pi/2])
+_RAT_RACE_PORT_ORIENTATIONS = (0, 90, 180, 270)
+# Exact unit direction of each port, so the port centres carry no cos/sin
+# rounding error
+_RAT_RACE_PORT_DIRECTIONS = ((1, 0), (0, 1), (-1, 0), (0, -1))
 
 
-@register_component
 class WilkinsonDivider(BasicStructure):
     """A Wilkinson power divider."""
 
@@ -20,147 +52,111 @@ class WilkinsonDivider(BasicStructure):
     isolation_resistor_length: float  # Length of the isolation resistor
     layer: Tuple[int, int] = (1, 0)  # Default layer
     resistor_layer: Tuple[int, int] = (2, 0)  # Layer for the resistor
+    arc_tolerance: float = 0.05  # Maximum chord error of the arcs
     
+    @cached_cell
     def to_gds(self) -> gf.Component:
         """Convert the Wilkinson divider to a GDS component.
         
         Returns:
             A gdsfactory Component
         """
-        # Create a new component
-        component = gf.Component(name=f"{self.name}")
+        # Create a new component (named by cached_cell)
+        component = gf.Component()
+        
+        # Local copies of the geometry parameters
+        r = self.radius
+        w = self.width
+        hw = w / 2
+        rw2 = self.isolation_resistor_width / 2
+        rl = self.isolation_resistor_length
+        layer = self.layer
         
         # Create the input line
-        input_line_length = self.radius / 2
-        input_line = component.add_polygon(
-            [
-                (-input_line_length, -self.width/2),
-                (0, -self.width/2),
-                (0, self.width/2),
-                (-input_line_length, self.width/2),
-            ],
-            layer=self.layer,
+        input_line_length = r / 2
+        input_line = self._add_rectangle(
+            component,
+            -input_line_length, -hw, 0, hw,
+            layer=layer,
         )
         
         # Create the quarter-wave sections
-        # Number of points for the arcs
-        n_points = 50
-        
-        # Top quarter-wave section
-        top_theta = np.linspace(0, np.pi/2, n_points)
-        top_inner_radius = self.radius - self.width/2
-        top_outer_radius = self.radius + self.width/2
+        # Both sections and the output lines share the same edge radii
+        inner_radius = r - hw
+        outer_radius = r + hw
         
-        top_inner_points = [(top_inner_radius * np.cos(t), top_inner_radius * np.sin(t)) for t in top_theta]
-        top_outer_points = [(top_outer_radius * np.cos(t), top_outer_radius * np.sin(t)) for t in reversed(top_theta)]
+        # Number of points for the arcs, from the chord error on the outer edge
+        n_points = _geom_kernels.arc_point_count(outer_radius, 90, self.arc_tolerance)
         
-        top_points = top_inner_points + top_outer_points
-        top_quarter_wave = component.add_polygon(top_points, layer=self.layer)
-        
-        # Bottom quarter-wave section
-        bottom_theta = np.linspace(-np.pi/2, 0, n_points)
-        bottom_inner_radius = self.radius - self.width/2
-        bottom_outer_radius = self.radius + self.width/2
-        
-        bottom_inner_points = [(bottom_inner_radius * np.cos(t), bottom_inner_radius * np.sin(t)) for t in bottom_theta]
-        bottom_outer_points = [(bottom_outer_radius * np.cos(t), bottom_outer_radius * np.sin(t)) for t in reversed(bottom_theta)]
+        # Top quarter-wave section, turned to start at (r, 0) heading north
+        top_quarter_wave = component.add_ref(
+            _arc_section(r, w, 90, layer, n_points), origin=(r, 0), rotation=90
+        )
         
-        bottom_points = bottom_inner_points + bottom_outer_points
-        bottom_quarter_wave = component.add_polygon(bottom_points, layer=self.layer)
+        # Bottom quarter-wave section, starting at (0, -r) heading east
+        bottom_quarter_wave = component.add_ref(
+            _arc_section(r, w, 90, layer, n_points), origin=(0, -r)
+        )
         
         # Create the output lines
-        output_line_length = self.radius / 2
+        output_line_length = r / 2
+        output_x = r + output_line_length
         
         # Top output line
-        top_output_line = component.add_polygon(
-            [
-                (self.radius, self.radius - self.width/2),
-                (self.radius + output_line_length, self.radius - self.width/2),
-                (self.radius + output_line_length, self.radius + self.width/2),
-                (self.radius, self.radius + self.width/2),
-            ],
-            layer=self.layer,
+        top_output_line = self._add_rectangle(
+            component,
+            r, inner_radius, output_x, outer_radius,
+            layer=layer,
         )
         
-        # Bottom output line
-        bottom_output_line = component.add_polygon(
-            [
-                (self.radius, -self.radius - self.width/2),
-                (self.radius + output_line_length, -self.radius - self.width/2),
-                (self.radius + output_line_length, -self.radius + self.width/2),
-                (self.radius, -self.radius + self.width/2),
-            ],
-            layer=self.layer,
+        # Bottom output line (the top line mirrored in y)
+        bottom_output_line = self._add_rectangle(
+            component,
+            r, -outer_radius, output_x, -inner_radius,
+            layer=layer,
         )
         
         # Create the isolation resistor
-        resistor = component.add_polygon(
-            [
-                (self.radius, self.radius - self.isolation_resistor_width/2),
-                (self.radius, -self.radius + self.isolation_resistor_width/2),
-                (self.radius + self.isolation_resistor_length, -self.radius + self.isolation_resistor_width/2),
-                (self.radius + self.isolation_resistor_length, self.radius - self.isolation_resistor_width/2),
-            ],
+        resistor = self._add_rectangle(
+            component,
+            r, -r + rw2, r + rl, r - rw2,
             layer=self.resistor_layer,
         )
         
         # Add ports
         # Input port
-        component.add_port(
+        self._register_port(
+            component,
             name="in",
             center=(-input_line_length, 0),
-            width=self.width,
+            width=w,
             orientation=180,
-            layer=self.layer,
+            layer=layer,
         )
         
         # Top output port
-        component.add_port(
+        self._register_port(
+            component,
             name="out1",
-            center=(self.radius + output_line_length, self.radius),
-            width=self.width,
+            center=(output_x, r),
+            width=w,
             orientation=0,
-            layer=self.layer,
+            layer=layer,
         )
         
         # Bottom output port
-        component.add_port(
-            name="out2",
-            center=(self.radius + output_line_length, -self.radius),
-            width=self.width,
-            orientation=0,
-            layer=self.layer,
-        )
-        
-        # Update our internal ports
-        self.add_port(
-            name="in",
-            position=(-input_line_length, 0),
-            width=self.width,
-            layer=self.layer,
-            orientation=180,
-        )
-        
-        self.add_port(
-            name="out1",
-            position=(self.radius + output_line_length, self.radius),
-            width=self.width,
-            layer=self.layer,
-            orientation=0,
-        )
-        
-        self.add_port(
+        self._register_port(
+            component,
             name="out2",
-            position=(self.radius + output_line_length, -self.radius),
-            width=self.width,
-            layer=self.layer,
+            center=(output_x, -r),
+            width=w,
             orientation=0,
+            layer=layer,
         )
         
         return component
 
 
-@register_component
 class BranchLineCoupler(BasicStructure):
     """A branch-line coupler (90° hybrid)."""
 
@@ -169,134 +165,97 @@ class BranchLineCoupler(BasicStructure):
     width: float  # Width of the transmission lines
     layer: Tuple[int, int] = (1, 0)  # Default layer
     
+    @cached_cell
     def to_gds(self) -> gf.Component:
         """Convert the branch-line coupler to a GDS component.
         
         Returns:
             A gdsfactory Component
         """
-        # Create a new component
-        component = gf.Component(name=f"{self.name}")
-        
-        # Create the four sides of the coupler
-        # Top side
-        top_side = component.add_polygon(
-            [
-                (0, self.size - self.width/2),
-                (self.size, self.size - self.width/2),
-                (self.size, self.size + self.width/2),
-                (0, self.size + self.width/2),
-            ],
-            layer=self.layer,
-        )
-        
-        # Right side
-        right_side = component.add_polygon(
-            [
-                (self.size - self.width/2, 0),
-                (self.size + self.width/2, 0),
-                (self.size + self.width/2, self.size),
-                (self.size - self.width/2, self.size),
-            ],
-            layer=self.layer,
-        )
-        
-        # Bottom side
-        bottom_side = component.add_polygon(
-            [
-                (0, -self.width/2),
-                (self.size, -self.width/2),
-                (self.size, self.width/2),
-                (0, self.width/2),
-            ],
-            layer=self.layer,
-        )
-        
-        # Left side
-        left_side = component.add_polygon(
-            [
-                (-self.width/2, 0),
-                (self.width/2, 0),
-                (self.width/2, self.size),
-                (-self.width/2, self.size),
-            ],
-            layer=self.layer,
+        # Create a new component (named by cached_cell)
+        component = gf.Component()
+        
+        # Local copies of the geometry parameters
+        size = self.size
+        w = self.width
+        hw = w / 2
+        layer = self.layer
+        
+        # Create the four sides of the coupler as one polygon
+        # The sides leave the hw x hw corner squares open, so the outline
+        # steps in at each corner. GDS polygons cannot have holes, so the
+        # inner boundary is reached through a zero-width cut at x = hw.
+        ring = component.add_polygon(
+            (
+                # Outer boundary, counter-clockwise
+                (hw, -hw),
+                (size, -hw),
+                (size, 0),
+                (size + hw, 0),
+                (size + hw, size),
+                (size, size),
+                (size, size + hw),
+                (0, size + hw),
+                (0, size),
+                (-hw, size),
+                (-hw, 0),
+                (0, 0),
+                (0, -hw),
+                (hw, -hw),
+                # Inner boundary, clockwise
+                (hw, hw),
+                (hw, size - hw),
+                (size - hw, size - hw),
+                (size - hw, hw),
+                (hw, hw),
+            ),
+            layer=layer,
         )
         
         # Add ports
         # Port 1 (input)
-        component.add_port(
+        self._register_port(
+            component,
             name="p1",
-            center=(-self.width/2, 0),
-            width=self.width,
+            center=(-hw, 0),
+            width=w,
             orientation=180,
-            layer=self.layer,
+            layer=layer,
         )
         
         # Port 2 (direct)
-        component.add_port(
+        self._register_port(
+            component,
             name="p2",
-            center=(self.size, -self.width/2),
-            width=self.width,
+            center=(size, -hw),
+            width=w,
             orientation=270,
-            layer=self.layer,
+            layer=layer,
         )
         
         # Port 3 (isolated)
-        component.add_port(
+        self._register_port(
+            component,
             name="p3",
-            center=(self.size + self.width/2, self.size),
-            width=self.width,
+            center=(size + hw, size),
+            width=w,
             orientation=0,
-            layer=self.layer,
+            layer=layer,
         )
         
         # Port 4 (coupled)
-        component.add_port(
+        self._register_port(
+            component,
             name="p4",
-            center=(0, self.size + self.width/2),
-            width=self.width,
-            orientation=90,
-            layer=self.layer,
-        )
-        
-        # Update our internal ports
-        self.add_port(
-            name="p1",
-            position=(-self.width/2, 0),
-            width=self.width,
-            layer=self.layer,
-            orientation=180,
-        )
-        
-        self.add_port(
-            name="p2",
-            position=(self.size, -self.width/2),
-            width=self.width,
-            layer=self.layer,
-            orientation=270,
-        )
-        
-        self.add_port(
-            name="p3",
-            position=(self.size + self.width/2, self.size),
-            width=self.width,
-            layer=self.layer,
-            orientation=0,
-        )
-        
-        self.add_port(
-            name="p4",
-            position=(0, self.size + self.width/2),
-            width=self.width,
-            layer=self.layer,
+            center=(0, size + hw),
+            width=w,
             orientation=90,
+            layer=layer,
         )
         
         return component
 
 
-@register_component
 class RatRaceCoupler(BasicStructure):
     """A rat-race coupler (180° hybrid)."""
 
@@ -304,76 +263,58 @@ class RatRaceCoupler(BasicStructure):
     radius: float  # Radius of the ring
     width: float  # Width of the transmission lines
     layer: Tuple[int, int] = (1, 0)  # Default layer
+    arc_tolerance: float = 0.05  # Maximum chord error of the ring
     
+    @cached_cell
     def to_gds(self) -> gf.Component:
         """Convert the rat-race coupler to a GDS component.
         
         Returns:
             A gdsfactory Component
         """
-        # Create a new component
-        component = gf.Component(name=f"{self.name}")
-        
-        # Create the ring
-        # Number of points for the ring
-        n_points = 100
-        
-        # Inner and outer radius
-        inner_radius = self.radius - self.width/2
-        outer_radius = self.radius + self.width/2
-        
-        # Create points for the ring
-        theta = np.linspace(0, 2*np.pi, n_points)
-        inner_points = [(inner_radius * np.cos(t), inner_radius * np.sin(t)) for t in theta]
-        outer_points = [(outer_radius * np.cos(t), outer_radius * np.sin(t)) for t in reversed(theta)]
-        
-        # Create the ring polygon
-        ring_points = inner_points + outer_points
-        ring = component.add_polygon(ring_points, layer=self.layer)
+        # Create a new component (named by cached_cell)
+        component = gf.Component()
+        
+        # Local copies of the geometry parameters
+        r = self.radius
+        w = self.width
+        hw = w / 2
+        layer = self.layer
+        
+        # Create the ring, starting at (r, 0) heading north
+        # Number of points for the ring, from the chord error on the outer edge
+        n_points = _geom_kernels.arc_point_count(r + hw, 360, self.arc_tolerance)
+        ring = component.add_ref(
+            _arc_section(r, w, 360, layer, n_points), origin=(r, 0), rotation=90
+        )
         
         # Create the four ports
         # Port positions (at 0°, 90°, 180°, and 270°)
-        port_angles = [0, np.pi/2, np.pi, 3*np.pi/2]
-        port_positions = [(self.radius * np.cos(angle), self.radius * np.sin(angle)) for angle in port_angles]
+        port_angles = _RAT_RACE_PORT_ANGLES
         
         # Port extensions
-        extension_length = self.radius / 2
-        
-        # Create the port extensions
-        for i, (x, y) in enumerate(port_positions):
-            # Calculate the extension direction
-            angle = port_angles[i]
-            dx = np.cos(angle)
-            dy = np.sin(angle)
-            
-            # Create the extension
-            extension = component.add_polygon(
-                [
-                    (x - self.width/2 * dy, y + self.width/2 * dx),
-                    (x + extension_length * dx - self.width/2 * dy, y + extension_length * dy + self.width/2 * dx),
-                    (x + extension_length * dx + self.width/2 * dy, y + extension_length * dy - self.width/2 * dx),
-                    (x + self.width/2 * dy, y - self.width/2 * dx),
-                ],
-                layer=self.layer,
-            )
+        extension_length = r / 2
+        extensions = _geom_kernels.rat_race_extensions(
+            float(r), float(w), float(extension_length), port_angles
+        )
+        
+        # Create the port extensions, as one batch of polygons
+        component.add_polygon(extensions, layer=layer)
+        
+        # Add the ports at the ends of the extensions
+        port_distance = r + extension_length
+        for i, orientation in enumerate(_RAT_RACE_PORT_ORIENTATIONS):
+            # Extension direction
+            dx, dy = _RAT_RACE_PORT_DIRECTIONS[i]
             
             # Add the port
-            orientation = int(np.degrees(angle))
-            component.add_port(
-                name=f"p{i+1}",
-                center=(x + extension_length * dx, y + extension_length * dy),
-                width=self.width,
-                orientation=orientation,
-                layer=self.layer,
-            )
-            
-            # Update our internal ports
-            self.add_port(
+            self._register_port(
+                component,
                 name=f"p{i+1}",
-                position=(x + extension_length * dx, y + extension_length * dy),
-                width=self.width,
-                layer=self.layer,
+                center=(port_distance * dx, port_distance * dy),
+                width=w,
                 orientation=orientation,
+                layer=layer,
             )
         
         return component
@@ -6,10 +6,10 @@ import math
 import gdsfactory as gf
 import numpy as np
 
-from rf_gds.components.base import PassiveComponent, register_component
+from rf_gds import _geom_kernels
+from rf_gds.components.base import PassiveComponent, cached_cell
 
 
-@register_component
 class MIMCapacitor(PassiveComponent):
     """A Metal-Insulator-Metal (MIM) capacitor."""
 
@@ -20,89 +20,67 @@ class MIMCapacitor(PassiveComponent):
     bottom_layer: Tuple[int, int] = (2, 0)  # Bottom metal layer
     dielectric_layer: Tuple[int, int] = (3, 0)  # Dielectric layer
     
+    @cached_cell
     def to_gds(self) -> gf.Component:
         """Convert the MIM capacitor to a GDS component.
         
         Returns:
             A gdsfactory Component
         """
-        # Create a new component
-        component = gf.Component(name=f"{self.name}")
+        # Create a new component (named by cached_cell)
+        component = gf.Component()
+        
+        # Local copies of the geometry parameters
+        length = self.length
+        w = self.width
+        hw = w / 2
         
         # Create the bottom plate (slightly larger than the top plate)
         bottom_margin = 1.0  # Extra margin for the bottom plate
-        bottom_plate = component.add_polygon(
-            [
-                (-bottom_margin, -self.width/2 - bottom_margin),
-                (self.length + bottom_margin, -self.width/2 - bottom_margin),
-                (self.length + bottom_margin, self.width/2 + bottom_margin),
-                (-bottom_margin, self.width/2 + bottom_margin),
-            ],
+        bottom_plate = self._add_rectangle(
+            component,
+            -bottom_margin, -hw - bottom_margin, length + bottom_margin, hw + bottom_margin,
             layer=self.bottom_layer,
         )
         
         # Create the dielectric layer (same size as the top plate)
-        dielectric = component.add_polygon(
-            [
-                (0, -self.width/2),
-                (self.length, -self.width/2),
-                (self.length, self.width/2),
-                (0, self.width/2),
-            ],
+        dielectric = self._add_rectangle(
+            component,
+            0, -hw, length, hw,
             layer=self.dielectric_layer,
         )
         
         # Create the top plate
-        top_plate = component.add_polygon(
-            [
-                (0, -self.width/2),
-                (self.length, -self.width/2),
-                (self.length, self.width/2),
-                (0, self.width/2),
-            ],
+        top_plate = self._add_rectangle(
+            component,
+            0, -hw, length, hw,
             layer=self.top_layer,
         )
         
         # Add ports
         # Port 1 (to the top plate)
-        component.add_port(
+        self._register_port(
+            component,
             name="p1",
-            center=(self.length/2, self.width/2 + 1),
-            width=self.width/4,
+            center=(length / 2, hw + 1),
+            width=w / 4,
             orientation=90,
             layer=self.top_layer,
         )
         
         # Port 2 (to the bottom plate)
-        component.add_port(
+        self._register_port(
+            component,
             name="p2",
-            center=(self.length/2, -self.width/2 - 1),
-            width=self.width/4,
+            center=(length / 2, -hw - 1),
+            width=w / 4,
             orientation=270,
             layer=self.bottom_layer,
         )
         
-        # Update our internal ports
-        self.add_port(
-            name="p1",
-            position=(self.length/2, self.width/2 + 1),
-            width=self.width/4,
-            layer=self.top_layer,
-            orientation=90,
-        )
-        
-        self.add_port(
-            name="p2",
-            position=(self.length/2, -self.width/2 - 1),
-            width=self.width/4,
-            layer=self.bottom_layer,
-            orientation=270,
-        )
-        
         return component
 
 
-@register_component
 class InterdigitatedCapacitor(PassiveComponent):
     """An interdigitated capacitor."""
 
@@ -113,108 +91,78 @@ class InterdigitatedCapacitor(PassiveComponent):
     finger_spacing: float  # Spacing between fingers
     layer: Tuple[int, int] = (1, 0)  # Default layer
     
+    @cached_cell
     def to_gds(self) -> gf.Component:
         """Convert the interdigitated capacitor to a GDS component.
         
         Returns:
             A gdsfactory Component
         """
-        # Create a new component
-        component = gf.Component(name=f"{self.name}")
+        # Create a new component (named by cached_cell)
+        component = gf.Component()
+        
+        # Local copies of the geometry parameters
+        n_fingers = self.n_fingers
+        finger_length = self.finger_length
+        finger_width = self.finger_width
+        finger_spacing = self.finger_spacing
+        layer = self.layer
         
         # Calculate the total width
-        total_width = (self.n_fingers + 1) * self.finger_spacing + self.n_fingers * self.finger_width
+        total_width = (n_fingers + 1) * finger_spacing + n_fingers * finger_width
         
         # Create the left bus
-        left_bus = component.add_polygon(
-            [
-                (-self.finger_width, -total_width/2),
-                (0, -total_width/2),
-                (0, total_width/2),
-                (-self.finger_width, total_width/2),
-            ],
-            layer=self.layer,
+        left_bus = self._add_rectangle(
+            component,
+            -finger_width, -total_width/2, 0, total_width/2,
+            layer=layer,
         )
         
         # Create the right bus
-        right_bus = component.add_polygon(
-            [
-                (self.finger_length, -total_width/2),
-                (self.finger_length + self.finger_width, -total_width/2),
-                (self.finger_length + self.finger_width, total_width/2),
-                (self.finger_length, total_width/2),
-            ],
-            layer=self.layer,
+        right_bus = self._add_rectangle(
+            component,
+            finger_length, -total_width/2, finger_length + finger_width, total_width/2,
+            layer=layer,
         )
         
         # Create the fingers
-        for i in range(self.n_fingers):
-            y_pos = -total_width/2 + self.finger_spacing + i * (self.finger_width + self.finger_spacing)
-            
-            # Alternate between left and right fingers
-            if i % 2 == 0:
-                # Left finger
-                finger = component.add_polygon(
-                    [
-                        (0, y_pos),
-                        (self.finger_length, y_pos),
-                        (self.finger_length, y_pos + self.finger_width),
-                        (0, y_pos + self.finger_width),
-                    ],
-                    layer=self.layer,
-                )
-            else:
-                # Right finger
-                finger = component.add_polygon(
-                    [
-                        (0, y_pos),
-                        (self.finger_length, y_pos),
-                        (self.finger_length, y_pos + self.finger_width),
-                        (0, y_pos + self.finger_width),
-                    ],
-                    layer=self.layer,
-                )
+        # Fingers alternate between the left and right bus, but every finger
+        # spans the same x range, so all of them share one vertex template
+        fingers = _geom_kernels.interdigitated_fingers(
+            n_fingers,
+            float(-total_width/2 + finger_spacing),
+            float(finger_width + finger_spacing),
+            float(finger_length),
+            float(finger_width),
+        )
+        
+        # An (n, 4, 2) array is added as a batch of polygons in one call
+        component.add_polygon(fingers, layer=layer)
         
         # Add ports
         # Port 1 (left)
-        component.add_port(
+        self._register_port(
+            component,
             name="p1",
-            center=(-self.finger_width, 0),
-            width=self.finger_width,
+            center=(-finger_width, 0),
+            width=finger_width,
             orientation=180,
-            layer=self.layer,
+            layer=layer,
         )
         
         # Port 2 (right)
-        component.add_port(
+        self._register_port(
+            component,
             name="p2",
-            center=(self.finger_length + self.finger_width, 0),
-            width=self.finger_width,
-            orientation=0,
-            layer=self.layer,
-        )
-        
-        # Update our internal ports
-        self.add_port(
-            name="p1",
-            position=(-self.finger_width, 0),
-            width=self.finger_width,
-            layer=self.layer,
-            orientation=180,
-        )
-        
-        self.add_port(
-            name="p2",
-            position=(self.finger_length + self.finger_width, 0),
-            width=self.finger_width,
-            layer=self.layer,
+            center=(finger_length + finger_width, 0),
+            width=finger_width,
             orientation=0,
+            layer=layer,
         )
         
         return component
 
 
-@register_component
 class ParallelPlateCapacitor(PassiveComponent):
     """A simple parallel plate capacitor."""
 
@@ -224,71 +172,55 @@ class ParallelPlateCapacitor(PassiveComponent):
     plate_spacing: float  # Spacing between plates
     layer: Tuple[int, int] = (1, 0)  # Default layer
     
+    @cached_cell
     def to_gds(self) -> gf.Component:
         """Convert the parallel plate capacitor to a GDS component.
         
         Returns:
             A gdsfactory Component
         """
-        # Create a new component
-        component = gf.Component(name=f"{self.name}")
+        # Create a new component (named by cached_cell)
+        component = gf.Component()
+        
+        # Local copies of the geometry parameters
+        length = self.length
+        w = self.width
+        hs = self.plate_spacing / 2
+        layer = self.layer
         
         # Create the top plate
-        top_plate = component.add_polygon(
-            [
-                (0, self.plate_spacing/2),
-                (self.length, self.plate_spacing/2),
-                (self.length, self.plate_spacing/2 + self.width),
-                (0, self.plate_spacing/2 + self.width),
-            ],
-            layer=self.layer,
+        top_plate = self._add_rectangle(
+            component,
+            0, hs, length, hs + w,
+            layer=layer,
         )
         
         # Create the bottom plate
-        bottom_plate = component.add_polygon(
-            [
-                (0, -self.plate_spacing/2 - self.width),
-                (self.length, -self.plate_spacing/2 - self.width),
-                (self.length, -self.plate_spacing/2),
-                (0, -self.plate_spacing/2),
-            ],
-            layer=self.layer,
+        bottom_plate = self._add_rectangle(
+            component,
+            0, -hs - w, length, -hs,
+            layer=layer,
         )
         
         # Add ports
         # Port 1 (top plate)
-        component.add_port(
+        self._register_port(
+            component,
             name="p1",
-            center=(self.length/2, self.plate_spacing/2 + self.width),
-            width=self.width/2,
+            center=(length / 2, hs + w),
+            width=w / 2,
             orientation=90,
-            layer=self.layer,
+            layer=layer,
         )
         
         # Port 2 (bottom plate)
-        component.add_port(
-            name="p2",
-            center=(self.length/2, -self.plate_spacing/2 - self.width),
-            width=self.width/2,
-            orientation=270,
-            layer=self.layer,
-        )
-        
-        # Update our internal ports
-        self.add_port(
-            name="p1",
-            position=(self.length/2, self.plate_spacing/2 + self.width),
-            width=self.width/2,
-            layer=self.layer,
-            orientation=90,
-        )
-        
-        self.add_port(
+        self._register_port(
+            component,
             name="p2",
-            position=(self.length/2, -self.plate_spacing/2 - self.width),
-            width=self.width/2,
-            layer=self.layer,
+            center=(length / 2, -hs - w),
+            width=w / 2,
             orientation=270,
+            layer=layer,
         )
         
         return component
@@ -1,15 +1,45 @@
 """Inductor components for RF GDS Library."""
 
 from typing import Dict, Any, Tuple, Optional, ClassVar, List
+import functools
 import math
 
 import gdsfactory as gf
 import numpy as np
 
-from rf_gds.components.base import PassiveComponent, register_component
+from rf_gds import _geom_kernels
+from rf_gds.components.base import PassiveComponent, cached_cell
+
+# Full and quarter turn, in radians
+_TAU = 2 * math.pi
+_PI_2 = math.pi / 2
+
+
+@functools.lru_cache(maxsize=256)
+def _spiral_xy(n_turns: float, inner_radius: float, spacing: float, n_points: int) -> np.ndarray:
+    """Get the centerline points of an Archimedean spiral.
+    
+    The points are shared between all inductors with the same spiral, so the
+    returned array is read-only.
+    
+    Args:
+        n_turns: Number of turns (can be fractional)
+        inner_radius: Radius at the start of the spiral
+        spacing: Radial pitch per turn
+        n_points: Number of points, including both ends
+        
+    Returns:
+        A read-only (N, 2) float64 array of (x, y) points, from the inside out
+    """
+    # r = inner_radius + spacing * theta / (2 * pi), for theta from 0 to
+    # 2 * pi * n_turns
+    points = _geom_kernels.spiral_xy(
+        float(inner_radius), float(spacing), float(_TAU * n_turns), int(n_points)
+    )
+    points.setflags(write=False)
+    return points
 
 
-@register_component
 class SpiralInductor(PassiveComponent):
     """A spiral inductor."""
 
@@ -19,51 +49,47 @@ class SpiralInductor(PassiveComponent):
     spacing: float  # Spacing between traces
     inner_radius: float  # Inner radius
     layer: Tuple[int, int] = (1, 0)  # Default layer
+    arc_tolerance: Optional[float] = None  # Maximum chord error (default: width / 10)
     
+    @cached_cell
     def to_gds(self) -> gf.Component:
         """Convert the spiral inductor to a GDS component.
         
         Returns:
             A gdsfactory Component
         """
-        # Create a new component
-        component = gf.Component(name=f"{self.name}")
-        
-        # Calculate spiral parameters
-        n_points = max(100, int(self.n_turns * 20))  # More points for more turns
-        theta = np.linspace(0, 2 * np.pi * self.n_turns, n_points)
-        
-        # Calculate the spiral radius at each point
-        # r = inner_radius + spacing * theta / (2 * pi)
-        radius = self.inner_radius + self.spacing * theta / (2 * np.pi)
-        
-        # Calculate the x, y coordinates
-        x = radius * np.cos(theta)
-        y = radius * np.sin(theta)
+        # Create a new component (named by cached_cell)
+        component = gf.Component()
+        
+        # Calculate the spiral points, with the point count from the chord
+        # error along the spiral
+        tolerance = self.arc_tolerance if self.arc_tolerance is not None else self.width / 10
+        n_points = _geom_kernels.spiral_point_count(
+            self.inner_radius, self.spacing, self.n_turns, tolerance
+        )
+        points = _spiral_xy(self.n_turns, self.inner_radius, self.spacing, n_points)
+        start_x, start_y = points[0]
         
         # Create the spiral path
-        points = list(zip(x, y))
-        spiral_path = component.add_path(points, width=self.width, layer=self.layer)
-        
-        # Calculate the outer radius
-        outer_radius = self.inner_radius + self.spacing * self.n_turns
+        spiral_path = self._add_path(component, points, width=self.width, layer=self.layer)
         
         # Add a straight segment to the outer port
         # Calculate the end point of the spiral
-        end_x = x[-1]
-        end_y = y[-1]
+        end_x, end_y = points[-1]
         
-        # Calculate the angle of the end point
-        end_angle = theta[-1] % (2 * np.pi)
+        # Calculate the angle of the end point, from the spiral parameters
+        end_angle = (_TAU * self.n_turns) % _TAU
         
         # Calculate the direction vector
-        dir_x = np.cos(end_angle + np.pi/2)
-        dir_y = np.sin(end_angle + np.pi/2)
+        dir_x = math.cos(end_angle + _PI_2)
+        dir_y = math.sin(end_angle + _PI_2)
         
-        # Create a straight path to the edge
-        straight_length = outer_radius + self.width
+        # Create a straight path to the edge, one trace width past the outer
+        # radius of the spiral
+        straight_length = self.inner_radius + self.spacing * self.n_turns + self.width
         
-        straight_path = component.add_path(
+        straight_path = self._add_path(
+            component,
             [(end_x, end_y), (end_x + dir_x * straight_length, end_y + dir_y * straight_length)],
             width=self.width,
             layer=self.layer,
@@ -71,47 +97,32 @@ class SpiralInductor(PassiveComponent):
         
         # Add ports
         # Inner port (at the center)
-        component.add_port(
+        self._register_port(
+            component,
             name="in",
-            center=(x[0], y[0]),
+            center=(start_x, start_y),
             width=self.width,
             orientation=0,  # This will need to be calculated based on the spiral
             layer=self.layer,
         )
         
-        # Outer port
+        # Outer port, facing along the straight segment
         outer_port_x = end_x + dir_x * straight_length
         outer_port_y = end_y + dir_y * straight_length
+        out_orientation = (math.degrees(end_angle) + 90) % 360
         
-        component.add_port(
+        self._register_port(
+            component,
             name="out",
             center=(outer_port_x, outer_port_y),
             width=self.width,
-            orientation=(np.degrees(end_angle) + 90) % 360,
-            layer=self.layer,
-        )
-        
-        # Update our internal ports
-        self.add_port(
-            name="in",
-            position=(x[0], y[0]),
-            width=self.width,
-            layer=self.layer,
-            orientation=0,
-        )
-        
-        self.add_port(
-            name="out",
-            position=(outer_port_x, outer_port_y),
-            width=self.width,
+            orientation=out_orientation,
             layer=self.layer,
-            orientation=(np.degrees(end_angle) + 90) % 360,
         )
         
         return component
 
 
-@register_component
 class SymmetricInductor(PassiveComponent):
     """A symmetric spiral inductor with two ports on opposite sides."""
 
@@ -122,91 +133,66 @@ class SymmetricInductor(PassiveComponent):
     inner_radius: float  # Inner radius
     underpass_layer: Tuple[int, int] = (2, 0)  # Layer for the underpass
     layer: Tuple[int, int] = (1, 0)  # Default layer
+    arc_tolerance: Optional[float] = None  # Maximum chord error (default: width / 10)
     
+    @cached_cell
     def to_gds(self) -> gf.Component:
         """Convert the symmetric inductor to a GDS component.
         
         Returns:
             A gdsfactory Component
         """
-        # Create a new component
-        component = gf.Component(name=f"{self.name}")
-        
-        # Calculate spiral parameters
-        n_points = max(100, int(self.n_turns * 20))  # More points for more turns
-        theta = np.linspace(0, 2 * np.pi * self.n_turns, n_points)
-        
-        # Calculate the spiral radius at each point
-        # r = inner_radius + spacing * theta / (2 * pi)
-        radius = self.inner_radius + self.spacing * theta / (2 * np.pi)
-        
-        # Calculate the x, y coordinates
-        x = radius * np.cos(theta)
-        y = radius * np.sin(theta)
+        # Create a new component (named by cached_cell)
+        component = gf.Component()
+        
+        # Calculate the spiral points, with the point count from the chord
+        # error along the spiral
+        tolerance = self.arc_tolerance if self.arc_tolerance is not None else self.width / 10
+        n_points = _geom_kernels.spiral_point_count(
+            self.inner_radius, self.spacing, self.n_turns, tolerance
+        )
+        points = _spiral_xy(self.n_turns, self.inner_radius, self.spacing, n_points)
+        start_x, start_y = points[0]
         
         # Create the spiral path
-        points = list(zip(x, y))
-        spiral_path = component.add_path(points, width=self.width, layer=self.layer)
+        spiral_path = self._add_path(component, points, width=self.width, layer=self.layer)
         
-        # Calculate the outer radius
-        outer_radius = self.inner_radius + self.spacing * self.n_turns
-        
-        # Add an underpass to connect to the center
-        # First, calculate the angle for the underpass
-        underpass_angle = np.pi  # 180 degrees, opposite to the start
-        
-        # Calculate the underpass path
-        underpass_x1 = -outer_radius - self.width
-        underpass_y1 = 0
+        # Add an underpass to connect to the center, along the negative x axis
+        # (opposite to the start) from one trace width past the outer radius
+        underpass_x1 = -(self.inner_radius + self.spacing * self.n_turns) - self.width
         underpass_x2 = -self.inner_radius
-        underpass_y2 = 0
         
-        underpass_path = component.add_path(
-            [(underpass_x1, underpass_y1), (underpass_x2, underpass_y2)],
+        underpass_path = self._add_path(
+            component,
+            [(underpass_x1, 0), (underpass_x2, 0)],
             width=self.width,
             layer=self.underpass_layer,
         )
         
         # Add ports
         # Port 1 (at the center)
-        component.add_port(
+        self._register_port(
+            component,
             name="p1",
-            center=(x[0], y[0]),
+            center=(start_x, start_y),
             width=self.width,
             orientation=0,
             layer=self.layer,
         )
         
         # Port 2 (at the underpass)
-        component.add_port(
+        self._register_port(
+            component,
             name="p2",
-            center=(underpass_x1, underpass_y1),
+            center=(underpass_x1, 0),
             width=self.width,
             orientation=180,
             layer=self.underpass_layer,
         )
         
-        # Update our internal ports
-        self.add_port(
-            name="p1",
-            position=(x[0], y[0]),
-            width=self.width,
-            layer=self.layer,
-            orientation=0,
-        )
-        
-        self.add_port(
-            name="p2",
-            position=(underpass_x1, underpass_y1),
-            width=self.width,
-            layer=self.underpass_layer,
-            orientation=180,
-        )
-        
         return component
 
 
-@register_component
 class SolenoidInductor(PassiveComponent):
     """A 3D solenoid inductor."""
 
@@ -220,91 +206,56 @@ class SolenoidInductor(PassiveComponent):
     bottom_layer: Tuple[int, int] = (2, 0)  # Bottom metal layer
     via_layer: Tuple[int, int] = (3, 0)  # Via layer
     
+    @cached_cell
     def to_gds(self) -> gf.Component:
         """Convert the solenoid inductor to a GDS component.
         
         Returns:
             A gdsfactory Component
         """
-        # Create a new component
-        component = gf.Component(name=f"{self.name}")
+        # Create a new component (named by cached_cell)
+        component = gf.Component()
+        
+        # Local copies of the geometry parameters
+        n_turns = self.n_turns
+        hd = self.diameter / 2
+        hw = self.width / 2
+        hv = self.via_size / 2
         
         # Calculate parameters
-        segment_length = self.length / self.n_turns
-        
-        # Create the solenoid
-        for i in range(self.n_turns):
-            # Calculate the position of this turn
-            x_start = i * segment_length
-            x_end = (i + 1) * segment_length
-            
-            # Top segment
-            if i % 2 == 0:
-                top_segment = component.add_polygon(
-                    [
-                        (x_start, -self.diameter/2 - self.width/2),
-                        (x_end, -self.diameter/2 - self.width/2),
-                        (x_end, -self.diameter/2 + self.width/2),
-                        (x_start, -self.diameter/2 + self.width/2),
-                    ],
-                    layer=self.top_layer,
-                )
-            else:
-                top_segment = component.add_polygon(
-                    [
-                        (x_start, self.diameter/2 - self.width/2),
-                        (x_end, self.diameter/2 - self.width/2),
-                        (x_end, self.diameter/2 + self.width/2),
-                        (x_start, self.diameter/2 + self.width/2),
-                    ],
-                    layer=self.top_layer,
-                )
-            
-            # Bottom segment
-            if i % 2 == 0:
-                bottom_segment = component.add_polygon(
-                    [
-                        (x_start, self.diameter/2 - self.width/2),
-                        (x_end, self.diameter/2 - self.width/2),
-                        (x_end, self.diameter/2 + self.width/2),
-                        (x_start, self.diameter/2 + self.width/2),
-                    ],
-                    layer=self.bottom_layer,
-                )
-            else:
-                bottom_segment = component.add_polygon(
-                    [
-                        (x_start, -self.diameter/2 - self.width/2),
-                        (x_end, -self.diameter/2 - self.width/2),
-                        (x_end, -self.diameter/2 + self.width/2),
-                        (x_start, -self.diameter/2 + self.width/2),
-                    ],
-                    layer=self.bottom_layer,
-                )
-            
-            # Add vias at the ends of the segments
-            if i < self.n_turns - 1:
-                # Via at the end of this turn
-                if i % 2 == 0:
-                    via = component.add_polygon(
-                        [
-                            (x_end - self.via_size/2, -self.diameter/2 - self.via_size/2),
-                            (x_end + self.via_size/2, -self.diameter/2 - self.via_size/2),
-                            (x_end + self.via_size/2, -self.diameter/2 + self.via_size/2),
-                            (x_end - self.via_size/2, -self.diameter/2 + self.via_size/2),
-                        ],
-                        layer=self.via_layer,
-                    )
-                else:
-                    via = component.add_polygon(
-                        [
-                            (x_end - self.via_size/2, self.diameter/2 - self.via_size/2),
-                            (x_end + self.via_size/2, self.diameter/2 - self.via_size/2),
-                            (x_end + self.via_size/2, self.diameter/2 + self.via_size/2),
-                            (x_end - self.via_size/2, self.diameter/2 + self.via_size/2),
-                        ],
-                        layer=self.via_layer,
-                    )
+        segment_length = self.length / n_turns
+        
+        # Create the solenoid, all turns at once
+        # Even turns have their top segment at y = -d/2 and their bottom
+        # segment at y = +d/2; odd turns the other way round
+        i = np.arange(n_turns)
+        x_start = i * segment_length
+        x_end = (i + 1) * segment_length
+        top_y = np.where(i % 2 == 0, -hd, hd)
+        bottom_y = -top_y
+        
+        # Top segments
+        top_segments = component.add_polygon(
+            _geom_kernels.rects(x_start, top_y - hw, x_end, top_y + hw),
+            layer=self.top_layer,
+        )
+        
+        # Bottom segments
+        bottom_segments = component.add_polygon(
+            _geom_kernels.rects(x_start, bottom_y - hw, x_end, bottom_y + hw),
+            layer=self.bottom_layer,
+        )
+        
+        # Add vias at the ends of the top segments, except after the last turn
+        # Every via is the same square, so its corners are one set of offsets
+        # broadcast over the via centers
+        if n_turns > 1:
+            via_centers = np.column_stack((x_end[:-1], top_y[:-1]))
+            via_offsets = np.array([(-hv, -hv), (hv, -hv), (hv, hv), (-hv, hv)])
+            vias = component.add_polygon(
+                via_centers[:, None, :] + via_offsets,
+                layer=self.via_layer,
+            )
         
         # Add ports
         # Port 1 (at the start)
@@ -315,7 +266,8 @@ class SolenoidInductor(PassiveComponent):
             p1_y = -self.diameter/2
             p1_layer = self.bottom_layer
         
-        component.add_port(
+        self._register_port(
+            component,
             name="p1",
             center=(0, p1_y),
             width=self.width,
@@ -331,7 +283,8 @@ class SolenoidInductor(PassiveComponent):
             p2_y = -self.diameter/2
             p2_layer = self.top_layer
         
-        component.add_port(
+        self._register_port(
+            component,
             name="p2",
             center=(self.length, p2_y),
             width=self.width,
@@ -339,21 +292,4 @@ class SolenoidInductor(PassiveComponent):
             layer=p2_layer,
         )
         
-        # Update our internal ports
-        self.add_port(
-            name="p1",
-            position=(0, p1_y),
-            width=self.width,
-            layer=p1_layer,
-            orientation=180,
-        )
-        
-        self.add_port(
-            name="p2",
-            position=(self.length, p2_y),
-            width=self.width,
-            layer=p2_layer,
-            orientation=0,
-        )
-        
         return component
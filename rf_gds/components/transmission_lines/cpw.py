@@ -1,14 +1,15 @@
 """Coplanar Waveguide (CPW) transmission line components."""
 
 from typing import Dict, Any, Tuple, Optional, ClassVar
+import math
 
 import gdsfactory as gf
 import numpy as np
 
-from rf_gds.components.base import TransmissionLine, register_component
+from rf_gds import _geom_kernels
+from rf_gds.components.base import TransmissionLine, cached_cell
 
 
-@register_component
 class CPWLine(TransmissionLine):
     """A simple coplanar waveguide transmission line."""
 
@@ -19,53 +20,38 @@ class CPWLine(TransmissionLine):
     ground_width: float = 10.0  # Ground plane width
     layer: Tuple[int, int] = (1, 0)  # Default layer
     
+    @cached_cell
     def to_gds(self) -> gf.Component:
         """Convert the CPW line to a GDS component.
         
         Returns:
             A gdsfactory Component
         """
-        # Create a new component
-        component = gf.Component(name=f"{self.name}")
-        
-        # Create the center conductor
-        center = component.add_polygon(
-            [
-                (0, -self.width/2),
-                (self.length, -self.width/2),
-                (self.length, self.width/2),
-                (0, self.width/2),
-            ],
-            layer=self.layer,
-        )
-        
-        # Create the ground planes
-        total_width = self.width + 2 * self.gap + 2 * self.ground_width
-        
-        # Top ground plane
-        top_ground = component.add_polygon(
-            [
-                (0, self.width/2 + self.gap),
-                (self.length, self.width/2 + self.gap),
-                (self.length, self.width/2 + self.gap + self.ground_width),
-                (0, self.width/2 + self.gap + self.ground_width),
-            ],
-            layer=self.layer,
-        )
-        
-        # Bottom ground plane
-        bottom_ground = component.add_polygon(
-            [
-                (0, -self.width/2 - self.gap - self.ground_width),
-                (self.length, -self.width/2 - self.gap - self.ground_width),
-                (self.length, -self.width/2 - self.gap),
-                (0, -self.width/2 - self.gap),
-            ],
-            layer=self.layer,
+        # Create a new component (named by cached_cell)
+        component = gf.Component()
+        
+        # Local copies of the geometry parameters
+        length = self.length
+        hw = self.width / 2
+        ground_inner = hw + self.gap  # Distance of the ground planes from the axis
+        ground_outer = ground_inner + self.ground_width
+        layer = self.layer
+        
+        # Create the center conductor and the ground planes above and below
+        # it, as one batch of rectangles
+        conductors = component.add_polygon(
+            _geom_kernels.rects(
+                0,
+                (-hw, ground_inner, -ground_outer),
+                length,
+                (hw, ground_outer, -ground_inner),
+            ),
+            layer=layer,
         )
         
         # Add ports
-        component.add_port(
+        self._register_port(
+            component,
             name="in",
             center=(0, 0),
             width=self.width,
@@ -73,7 +59,8 @@ class CPWLine(TransmissionLine):
             layer=self.layer,
         )
         
-        component.add_port(
+        self._register_port(
+            component,
             name="out",
             center=(self.length, 0),
             width=self.width,
@@ -81,27 +68,9 @@ class CPWLine(TransmissionLine):
             layer=self.layer,
         )
         
-        # Update our internal ports
-        self.add_port(
-            name="in",
-            position=(0, 0),
-            width=self.width,
-            layer=self.layer,
-            orientation=180,
-        )
-        
-        self.add_port(
-            name="out",
-            position=(self.length, 0),
-            width=self.width,
-            layer=self.layer,
-            orientation=0,
-        )
-        
         return component
 
 
-@register_component
 class CPWBend(TransmissionLine):
     """A coplanar waveguide bend."""
 
@@ -113,29 +82,29 @@ class CPWBend(TransmissionLine):
     angle: float = 90  # Default 90 degree bend
     layer: Tuple[int, int] = (1, 0)  # Default layer
     
+    @cached_cell
     def to_gds(self) -> gf.Component:
         """Convert the CPW bend to a GDS component.
         
         Returns:
             A gdsfactory Component
         """
-        # Create a new component
-        component = gf.Component(name=f"{self.name}")
+        # Create a new component (named by cached_cell)
+        component = gf.Component()
         
         # Calculate the arc
-        angle_rad = np.radians(self.angle)
+        angle_rad = math.radians(self.angle)
         n_points = max(10, int(self.angle / 5))  # More points for larger angles
-        theta = np.linspace(0, angle_rad, n_points)
+        
+        # Unit arc, shared by the edges of the conductor and both grounds
+        c, s = _geom_kernels.unit_arc(0.0, angle_rad, n_points)
         
         # Center conductor
         inner_radius = self.radius - self.width/2
         outer_radius = self.radius + self.width/2
         
-        inner_points = [(inner_radius * np.cos(t), inner_radius * np.sin(t)) for t in theta]
-        outer_points = [(outer_radius * np.cos(t), outer_radius * np.sin(t)) for t in reversed(theta)]
-        
         # Create the center conductor polygon
-        center_points = inner_points + outer_points
+        center_points = _geom_kernels.arc_ring(inner_radius, outer_radius, c, s)
         center = component.add_polygon(center_points, layer=self.layer)
         
         # Ground planes
@@ -143,32 +112,27 @@ class CPWBend(TransmissionLine):
         inner_ground_inner = self.radius - self.width/2 - self.ground_width
         inner_ground_outer = self.radius - self.width/2 - self.gap
         
-        inner_ground_inner_points = [(inner_ground_inner * np.cos(t), inner_ground_inner * np.sin(t)) for t in theta]
-        inner_ground_outer_points = [(inner_ground_outer * np.cos(t), inner_ground_outer * np.sin(t)) for t in reversed(theta)]
-        
-        inner_ground_points = inner_ground_inner_points + inner_ground_outer_points
+        inner_ground_points = _geom_kernels.arc_ring(inner_ground_inner, inner_ground_outer, c, s)
         inner_ground = component.add_polygon(inner_ground_points, layer=self.layer)
         
         # Outer ground
         outer_ground_inner = self.radius + self.width/2 + self.gap
         outer_ground_outer = self.radius + self.width/2 + self.gap + self.ground_width
         
-        outer_ground_inner_points = [(outer_ground_inner * np.cos(t), outer_ground_inner * np.sin(t)) for t in theta]
-        outer_ground_outer_points = [(outer_ground_outer * np.cos(t), outer_ground_outer * np.sin(t)) for t in reversed(theta)]
-        
-        outer_ground_points = outer_ground_inner_points + outer_ground_outer_points
+        outer_ground_points = _geom_kernels.arc_ring(outer_ground_inner, outer_ground_outer, c, s)
         outer_ground = component.add_polygon(outer_ground_points, layer=self.layer)
         
         # Calculate port positions and orientations
         in_pos = (self.radius, 0)
         in_orientation = 180
         
-        out_angle = np.radians(self.angle)
-        out_pos = (self.radius * np.cos(out_angle), self.radius * np.sin(out_angle))
+        out_angle = angle_rad
+        out_pos = (self.radius * math.cos(out_angle), self.radius * math.sin(out_angle))
         out_orientation = (self.angle + 90) % 360
         
         # Add ports
-        component.add_port(
+        self._register_port(
+            component,
             name="in",
             center=in_pos,
             width=self.width,
@@ -176,7 +140,8 @@ class CPWBend(TransmissionLine):
             layer=self.layer,
         )
         
-        component.add_port(
+        self._register_port(
+            component,
             name="out",
             center=out_pos,
             width=self.width,
@@ -184,27 +149,9 @@ class CPWBend(TransmissionLine):
             layer=self.layer,
         )
         
-        # Update our internal ports
-        self.add_port(
-            name="in",
-            position=in_pos,
-            width=self.width,
-            layer=self.layer,
-            orientation=in_orientation,
-        )
-        
-        self.add_port(
-            name="out",
-            position=out_pos,
-            width=self.width,
-            layer=self.layer,
-            orientation=out_orientation,
-        )
-        
         return component
 
 
-@register_component
 class CPWTaper(TransmissionLine):
     """A coplanar waveguide taper."""
 
@@ -217,51 +164,56 @@ class CPWTaper(TransmissionLine):
     ground_width: float = 10.0  # Ground plane width
     layer: Tuple[int, int] = (1, 0)  # Default layer
     
+    @cached_cell
     def to_gds(self) -> gf.Component:
         """Convert the CPW taper to a GDS component.
         
         Returns:
             A gdsfactory Component
         """
-        # Create a new component
-        component = gf.Component(name=f"{self.name}")
-        
-        # Create the center conductor
-        center = component.add_polygon(
-            [
-                (0, -self.width_in/2),
-                (self.length, -self.width_out/2),
-                (self.length, self.width_out/2),
-                (0, self.width_in/2),
-            ],
-            layer=self.layer,
-        )
-        
-        # Create the ground planes
-        # Top ground plane
-        top_ground = component.add_polygon(
-            [
-                (0, self.width_in/2 + self.gap_in),
-                (self.length, self.width_out/2 + self.gap_out),
-                (self.length, self.width_out/2 + self.gap_out + self.ground_width),
-                (0, self.width_in/2 + self.gap_in + self.ground_width),
-            ],
-            layer=self.layer,
-        )
-        
-        # Bottom ground plane
-        bottom_ground = component.add_polygon(
-            [
-                (0, -self.width_in/2 - self.gap_in - self.ground_width),
-                (self.length, -self.width_out/2 - self.gap_out - self.ground_width),
-                (self.length, -self.width_out/2 - self.gap_out),
-                (0, -self.width_in/2 - self.gap_in),
-            ],
-            layer=self.layer,
+        # Create a new component (named by cached_cell)
+        component = gf.Component()
+        
+        # Local copies of the geometry parameters
+        length = self.length
+        hw_in = self.width_in / 2
+        hw_out = self.width_out / 2
+        ground_inner_in = hw_in + self.gap_in  # Distance of the ground planes from the axis
+        ground_inner_out = hw_out + self.gap_out
+        ground_outer_in = ground_inner_in + self.ground_width
+        ground_outer_out = ground_inner_out + self.ground_width
+        layer = self.layer
+        
+        # Create the center conductor and the ground planes, as one batch of
+        # polygons
+        conductors = component.add_polygon(
+            np.array(
+                [
+                    # Center conductor
+                    [(0, -hw_in), (length, -hw_out), (length, hw_out), (0, hw_in)],
+                    # Top ground plane
+                    [
+                        (0, ground_inner_in),
+                        (length, ground_inner_out),
+                        (length, ground_outer_out),
+                        (0, ground_outer_in),
+                    ],
+                    # Bottom ground plane
+                    [
+                        (0, -ground_outer_in),
+                        (length, -ground_outer_out),
+                        (length, -ground_inner_out),
+                        (0, -ground_inner_in),
+                    ],
+                ],
+                dtype=np.float64,
+            ),
+            layer=layer,
         )
         
         # Add ports
-        component.add_port(
+        self._register_port(
+            component,
             name="in",
             center=(0, 0),
             width=self.width_in,
@@ -269,7 +221,8 @@ class CPWTaper(TransmissionLine):
             layer=self.layer,
         )
         
-        component.add_port(
+        self._register_port(
+            component,
             name="out",
             center=(self.length, 0),
             width=self.width_out,
@@ -277,21 +230,4 @@ class CPWTaper(TransmissionLine):
             layer=self.layer,
         )
         
-        # Update our internal ports
-        self.add_port(
-            name="in",
-            position=(0, 0),
-            width=self.width_in,
-            layer=self.layer,
-            orientation=180,
-        )
-        
-        self.add_port(
-            name="out",
-            position=(self.length, 0),
-            width=self.width_out,
-            layer=self.layer,
-            orientation=0,
-        )
-        
         return component
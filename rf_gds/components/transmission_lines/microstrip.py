@@ -1,14 +1,15 @@
 """Microstrip transmission line components."""
 
-from typing import Dict, Any, Tuple, Optional, ClassVar
+from typing import Dict, Any, Tuple, Optional, ClassVar, Union
+import math
 
 import gdsfactory as gf
 import numpy as np
 
-from rf_gds.components.base import TransmissionLine, register_component
+from rf_gds import _geom_kernels
+from rf_gds.components.base import TransmissionLine, cached_cell
 
 
-@register_component
 class MicrostripLine(TransmissionLine):
     """A simple microstrip transmission line."""
 
@@ -17,67 +18,51 @@ class MicrostripLine(TransmissionLine):
     width: float
     layer: Union[Tuple[int, int], str] = (1, 0)  # Default layer or layer name
     
+    @cached_cell
     def to_gds(self) -> gf.Component:
         """Convert the microstrip line to a GDS component.
         
         Returns:
             A gdsfactory Component
         """
-        # Create a new component
-        component = gf.Component(name=f"{self.name}")
+        # Create a new component (named by cached_cell)
+        component = gf.Component()
         
         # Get the layer from PDK if available
         layer = self.get_layer(self.layer) if hasattr(self, 'get_layer') else self.layer
         
+        # Local copies of the geometry parameters
+        length = self.length
+        hw = self.width / 2
+        
         # Create the microstrip line
-        path = component.add_polygon(
-            [
-                (0, -self.width/2),
-                (self.length, -self.width/2),
-                (self.length, self.width/2),
-                (0, self.width/2),
-            ],
-            layer=layer,
-        )
+        path = component.add_polygon(_geom_kernels.rects(0, -hw, length, hw), layer=layer)
         
-        # Add ports
-        component.add_port(
+        # Add ports, keeping the layer as given (possibly a PDK layer name)
+        # on this component's ports
+        self._register_port(
+            component,
             name="in",
             center=(0, 0),
             width=self.width,
             orientation=180,
             layer=layer,
+            model_layer=self.layer,
         )
         
-        component.add_port(
+        self._register_port(
+            component,
             name="out",
             center=(self.length, 0),
             width=self.width,
             orientation=0,
             layer=layer,
-        )
-        
-        # Update our internal ports
-        self.add_port(
-            name="in",
-            position=(0, 0),
-            width=self.width,
-            layer=self.layer,
-            orientation=180,
-        )
-        
-        self.add_port(
-            name="out",
-            position=(self.length, 0),
-            width=self.width,
-            layer=self.layer,
-            orientation=0,
+            model_layer=self.layer,
         )
         
         return component
 
 
-@register_component
 class TaperedMicrostripLine(TransmissionLine):
     """A tapered microstrip transmission line."""
 
@@ -87,28 +72,33 @@ class TaperedMicrostripLine(TransmissionLine):
     width_out: float
     layer: Tuple[int, int] = (1, 0)  # Default layer
     
+    @cached_cell
     def to_gds(self) -> gf.Component:
         """Convert the tapered microstrip line to a GDS component.
         
         Returns:
             A gdsfactory Component
         """
-        # Create a new component
-        component = gf.Component(name=f"{self.name}")
+        # Create a new component (named by cached_cell)
+        component = gf.Component()
+        
+        # Local copies of the geometry parameters
+        length = self.length
+        hw_in = self.width_in / 2
+        hw_out = self.width_out / 2
         
         # Create the tapered microstrip line
         path = component.add_polygon(
-            [
-                (0, -self.width_in/2),
-                (self.length, -self.width_out/2),
-                (self.length, self.width_out/2),
-                (0, self.width_in/2),
-            ],
+            np.array(
+                [(0, -hw_in), (length, -hw_out), (length, hw_out), (0, hw_in)],
+                dtype=np.float64,
+            ),
             layer=self.layer,
         )
         
         # Add ports
-        component.add_port(
+        self._register_port(
+            component,
             name="in",
             center=(0, 0),
             width=self.width_in,
@@ -116,7 +106,8 @@ class TaperedMicrostripLine(TransmissionLine):
             layer=self.layer,
         )
         
-        component.add_port(
+        self._register_port(
+            component,
             name="out",
             center=(self.length, 0),
             width=self.width_out,
@@ -124,27 +115,9 @@ class TaperedMicrostripLine(TransmissionLine):
             layer=self.layer,
         )
         
-        # Update our internal ports
-        self.add_port(
-            name="in",
-            position=(0, 0),
-            width=self.width_in,
-            layer=self.layer,
-            orientation=180,
-        )
-        
-        self.add_port(
-            name="out",
-            position=(self.length, 0),
-            width=self.width_out,
-            layer=self.layer,
-            orientation=0,
-        )
-        
         return component
 
 
-@register_component
 class CurvedMicrostripLine(TransmissionLine):
     """A curved microstrip transmission line."""
 
@@ -154,43 +127,43 @@ class CurvedMicrostripLine(TransmissionLine):
     angle: float = 90  # Default 90 degree bend
     layer: Tuple[int, int] = (1, 0)  # Default layer
     
+    @cached_cell
     def to_gds(self) -> gf.Component:
         """Convert the curved microstrip line to a GDS component.
         
         Returns:
             A gdsfactory Component
         """
-        # Create a new component
-        component = gf.Component(name=f"{self.name}")
+        # Create a new component (named by cached_cell)
+        component = gf.Component()
         
         # Calculate the arc
-        angle_rad = np.radians(self.angle)
+        angle_rad = math.radians(self.angle)
         n_points = max(10, int(self.angle / 5))  # More points for larger angles
-        theta = np.linspace(0, angle_rad, n_points)
+        
+        # Unit arc, shared by the inner and outer edges
+        c, s = _geom_kernels.unit_arc(0.0, angle_rad, n_points)
         
         # Inner and outer radius
         inner_radius = self.radius - self.width/2
         outer_radius = self.radius + self.width/2
         
-        # Create points for the arc
-        inner_points = [(inner_radius * np.cos(t), inner_radius * np.sin(t)) for t in theta]
-        outer_points = [(outer_radius * np.cos(t), outer_radius * np.sin(t)) for t in reversed(theta)]
-        
-        # Create the polygon
-        all_points = inner_points + outer_points
+        # Create the polygon, inner edge out and outer edge back
+        all_points = _geom_kernels.arc_ring(inner_radius, outer_radius, c, s)
         path = component.add_polygon(all_points, layer=self.layer)
         
         # Calculate port positions and orientations
         in_pos = (inner_radius + self.width/2, 0)
         in_orientation = 180
         
-        out_angle = np.radians(self.angle)
-        out_pos = ((inner_radius + self.width/2) * np.cos(out_angle), 
-                  (inner_radius + self.width/2) * np.sin(out_angle))
+        out_angle = angle_rad
+        out_pos = ((inner_radius + self.width/2) * math.cos(out_angle), 
+                  (inner_radius + self.width/2) * math.sin(out_angle))
         out_orientation = (self.angle + 90) % 360
         
         # Add ports
-        component.add_port(
+        self._register_port(
+            component,
             name="in",
             center=in_pos,
             width=self.width,
@@ -198,7 +171,8 @@ class CurvedMicrostripLine(TransmissionLine):
             layer=self.layer,
         )
         
-        component.add_port(
+        self._register_port(
+            component,
             name="out",
             center=out_pos,
             width=self.width,
@@ -206,21 +180,4 @@ class CurvedMicrostripLine(TransmissionLine):
             layer=self.layer,
         )
         
-        # Update our internal ports
-        self.add_port(
-            name="in",
-            position=in_pos,
-            width=self.width,
-            layer=self.layer,
-            orientation=in_orientation,
-        )
-        
-        self.add_port(
-            name="out",
-            position=out_pos,
-            width=self.width,
-            layer=self.layer,
-            orientation=out_orientation,
-        )
-        
         return component
@@ -1,16 +1,46 @@
 """Core functionality for RF GDS Library."""
 
 import os
-from typing import Dict, List, Optional, Union, Any
+import copy
+import json
+import hashlib
+import logging
+import tempfile
+import functools
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Union, Any
 
 import yaml
-import gdsfactory as gf
+
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    # PyYAML was built without libyaml
+    from yaml import SafeLoader as _Loader
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 from pydantic import BaseModel, Field
 
-from rf_gds.components import Component
+from rf_gds.components import Component, Port
+from rf_gds.components.base import GEOMETRY_VERSION, _pdk_key
 from rf_gds.yaml_parser import parse_yaml_to_design
 from rf_gds.pdk import PDK, get_pdk
 
+if TYPE_CHECKING:
+    # Imported at runtime by the functions that build geometry
+    import gdsfactory as gf
+
+logger = logging.getLogger(__name__)
+
+# Design files of at least this size are read through a larger buffer, so
+# that libyaml's small reads are served with fewer read() system calls
+_LARGE_FILE_SIZE = 64 * 1024
+_LARGE_FILE_BUFFER = 1024 * 1024
+
 
 class Design(BaseModel):
     """Represents a complete RF design."""
@@ -33,50 +63,425 @@ class Design(BaseModel):
             self._pdk = get_pdk(self.technology)
         return self._pdk
 
-    def to_gds(self, filename: Optional[str] = None) -> gf.Component:
+    def to_gds(self, filename: Optional[str] = None,
+               cache_dir: Optional[Union[str, os.PathLike]] = None,
+               jobs: int = 1) -> "gf.Component":
         """Convert the design to a GDS component.
         
         Args:
             filename: Optional filename to write the GDS to
+            cache_dir: Optional directory in which each component's GDS is
+                cached under a hash of its parameters, so that unchanged
+                components are read back instead of rebuilt
+            jobs: Number of worker processes used to build the components
             
         Returns:
             The top-level gdsfactory Component
         """
+        import gdsfactory as gf
+        
         # Create a top-level component
         top = gf.Component(name=self.name)
         
-        # Add all components to the top-level component
-        for component in self.components:
-            # Pass the PDK to the component if it has a set_pdk method
-            if hasattr(component, 'set_pdk'):
-                component.set_pdk(self.pdk)
-                
-            gds_component = component.to_gds()
-            top.add_ref(gds_component, position=component.position, rotation=component.rotation)
+        # Pass the PDK to the components, looking the PDK and component list
+        # up once. Every Component defines set_pdk, so no per-component
+        # attribute check is needed.
+        pdk = self.pdk
+        components = self.components
+        for component in components:
+            component.set_pdk(pdk)
+        
+        # Build the components, in parallel if requested
+        build = functools.partial(_build_component, cache_dir=cache_dir)
+        if jobs > 1 and len(components) > 1:
+            # Each worker names its cells independently, so only unique
+            # component names give unique cells; in this process gdsfactory
+            # renames same-named cells itself
+            names = [component.name for component in components]
+            if len(set(names)) < len(names):
+                duplicates = sorted({name for name in names if names.count(name) > 1})
+                raise ValueError(
+                    f"Component names must be unique to build in parallel: {', '.join(duplicates)}"
+                )
+            with ProcessPoolExecutor(max_workers=jobs) as executor:
+                results = list(executor.map(build, components))
+            # The workers built copies of the components, so copy their ports back
+            for component, (_, ports) in zip(components, results):
+                component.ports.update(ports)
+        else:
+            results = [build(component) for component in components]
+        
+        # Add all components to the top-level component, in design order so
+        # that cell naming stays deterministic
+        add_ref = top.add_ref
+        for component, (gds_component, _) in zip(components, results):
+            add_ref(gds_component, origin=component.position, rotation=component.rotation)
+        
+        # Components read back from the cache or built by workers carry
+        # their own copies of shared cells such as gdsfactory rectangles.
+        # Those are named after their parameters, so once same-named cells
+        # are checked to be identical, one copy is kept on write.
+        _check_duplicate_cells(top)
             
         # Write to file if filename is provided
         if filename:
-            top.write_gds(filename)
+            top.write_gds(filename, on_duplicate_cell="overwrite")
             
         return top
 
 
+def _cell_signature(cell: "gf.Component") -> Tuple[Any, ...]:
+    """Get the geometry of a cell, without that of the cells it references.
+    
+    Args:
+        cell: The gdsfactory Component
+        
+    Returns:
+        A hashable description of the polygons and references of the cell
+    """
+    gdstk_cell = cell._cell
+    polygons = sorted(
+        (polygon.layer, polygon.datatype, tuple(map(tuple, polygon.points.round(3).tolist())))
+        for polygon in gdstk_cell.get_polygons(depth=0)
+    )
+    references = sorted(
+        (ref.cell_name, tuple(ref.origin), ref.rotation, ref.magnification, ref.x_reflection)
+        for ref in gdstk_cell.references
+    )
+    return tuple(polygons), tuple(references)
+
+
+def _check_duplicate_cells(top: "gf.Component") -> None:
+    """Check that cells sharing a name in a layout are identical.
+    
+    Only one cell of each name is written to a GDS file, so cells that
+    share a name but differ, e.g. two components of the same name, would
+    silently lose geometry.
+    
+    Args:
+        top: The top-level gdsfactory Component
+        
+    Raises:
+        ValueError: If two different cells share a name
+    """
+    cells: Dict[str, List["gf.Component"]] = {top.name: [top]}
+    for cell in top.get_dependencies(recursive=True):
+        cells.setdefault(cell.name, []).append(cell)
+    
+    for name, same_named in cells.items():
+        if len(same_named) < 2:
+            continue
+        signature = _cell_signature(same_named[0])
+        if any(_cell_signature(cell) != signature for cell in same_named[1:]):
+            raise ValueError(
+                f"Different cells are named {name}; component names must be unique"
+            )
+
+
+def _build_component(component: Component,
+                     cache_dir: Optional[Union[str, os.PathLike]] = None):
+    """Convert a single component to GDS.
+    
+    Args:
+        component: The component to convert
+        cache_dir: Optional directory holding cached GDS files
+        
+    Returns:
+        A tuple of the gdsfactory Component and the ports registered on the
+        component
+    """
+    if cache_dir is None:
+        gds_component = component.to_gds()
+    else:
+        gds_component = _cached_to_gds(component, cache_dir)
+    return gds_component, component.ports
+
+
+def _cache_key(component: Component) -> str:
+    """Return a content hash identifying the GDS generated by a component.
+    
+    Args:
+        component: The component
+        
+    Returns:
+        A hex digest of the component type, its parameters, the PDK and the
+        package and geometry versions
+    """
+    from rf_gds import __version__
+    
+    # mode="json" lets pydantic-core produce plain JSON types in one pass
+    data = component.model_dump(
+        mode="json", exclude={"position", "rotation", "ports", "connections"}
+    )
+    data["type"] = component.type
+    data["pdk"] = _pdk_key(component._pdk)
+    data["version"] = __version__
+    data["geometry_version"] = GEOMETRY_VERSION
+    if orjson is not None:
+        payload = orjson.dumps(data, option=orjson.OPT_SORT_KEYS)
+    else:
+        payload = json.dumps(data, sort_keys=True, separators=(",", ":")).encode()
+    return hashlib.blake2b(payload).hexdigest()[:16]
+
+
+# Metadata key of the component ports in cached GDS files
+_PORTS_INFO_KEY = "rf_gds_ports"
+
+
+def _cached_to_gds(component: Component, cache_dir: Union[str, os.PathLike]) -> "gf.Component":
+    """Convert a component to GDS, reusing a cached GDS file if one exists.
+    
+    Args:
+        component: The component to convert
+        cache_dir: Directory holding the cached GDS files
+        
+    Returns:
+        A gdsfactory Component
+    """
+    import gdsfactory as gf
+    
+    path = Path(cache_dir) / f"{_cache_key(component)}.gds"
+    if path.exists():
+        gds_component = gf.read.import_gds(path, read_metadata=True)
+        # Restore the ports that to_gds() would have registered, as stored
+        # in the metadata, so that layer names given by the user are kept
+        ports_json = gds_component.info.get(_PORTS_INFO_KEY)
+        if ports_json is not None:
+            for name, data in json.loads(ports_json).items():
+                component.ports[name] = Port.model_validate(data)
+            return gds_component
+        # Files without the metadata only have the GDS ports
+        for port in gds_component.ports.values():
+            component.add_port(
+                name=port.name,
+                position=tuple(port.center),
+                width=port.width,
+                layer=tuple(port.layer),
+                orientation=port.orientation,
+            )
+        return gds_component
+    
+    gds_component = component.to_gds()
+    # gdsfactory metadata values must be scalars, so store the ports as JSON
+    gds_component.info[_PORTS_INFO_KEY] = json.dumps(
+        {name: port.model_dump(mode="json") for name, port in component.ports.items()}
+    )
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Write into a temporary directory next to the cache file and move the
+    # files into place, so an interrupted or concurrent write never leaves
+    # a truncated file under the final name. The metadata is moved first,
+    # so it is there whenever the GDS file is.
+    with tempfile.TemporaryDirectory(dir=path.parent) as tmp_dir:
+        tmp_path = Path(tmp_dir) / path.name
+        gds_component.write_gds(tmp_path, with_metadata=True)
+        os.replace(tmp_path.with_suffix(".yml"), path.with_suffix(".yml"))
+        os.replace(tmp_path, path)
+    return gds_component
+
+
 def load_design(yaml_file: Union[str, os.PathLike]) -> Design:
     """Load a design from a YAML file.
     
+    Parsed designs are cached by path, modification time and size, so
+    loading an unchanged file again only copies the cached design. Call
+    ``load_design.cache_clear()`` to drop the cache.
+    
     Args:
         yaml_file: Path to the YAML file
         
+    Returns:
+        A Design object, which the caller may modify
+    """
+    path = os.path.abspath(os.fspath(yaml_file))
+    stat = os.stat(path)
+    design = _load_design_file(path, stat.st_mtime_ns, stat.st_size)
+    # Copy everything but the PDK, which is the instance shared by get_pdk()
+    pdk = design._pdk
+    return copy.deepcopy(design, {id(pdk): pdk})
+
+
+def read_yaml(yaml_file: Union[str, os.PathLike], buffering: int = -1) -> Any:
+    """Parse a YAML file with the fastest available safe loader.
+    
+    Args:
+        yaml_file: Path to the YAML file
+        buffering: Read buffer size in bytes, -1 for the default
+        
+    Returns:
+        The YAML data
+    """
+    if _Loader is yaml.SafeLoader:
+        _warn_no_libyaml()
+    
+    # libyaml reads and decodes the binary stream itself
+    with open(yaml_file, "rb", buffering=buffering) as f:
+        return yaml.load(f, Loader=_Loader)
+
+
+@functools.lru_cache(maxsize=None)
+def _warn_no_libyaml() -> None:
+    """Log, once per process, that YAML is parsed without libyaml."""
+    logger.warning(
+        "PyYAML was built without libyaml, so design files are parsed about "
+        "10x slower. Install libyaml (e.g. libyaml-dev) and reinstall PyYAML "
+        "with 'pip install --force-reinstall --no-binary pyyaml pyyaml'."
+    )
+
+
+# Top-level fields returned by peek_design_header()
+_HEADER_FIELDS = ("name", "technology")
+
+
+def peek_design_header(yaml_file: Union[str, os.PathLike]) -> Dict[str, Any]:
+    """Read the top-level name and technology of a design file.
+    
+    The file is scanned as a stream of YAML events, which libyaml reads in
+    small chunks, and scanning stops as soon as both fields have been seen.
+    No Python objects are built for the components, so when the fields come
+    first, as in the examples, only the start of the file is read.
+    
+    Values are resolved as the YAML loader would, so ``~`` and ``null`` are
+    None. Files the scan cannot handle exactly, i.e. malformed YAML, a
+    field given as an alias, a merge key or a complex top-level key, are
+    parsed in full instead.
+    
+    Args:
+        yaml_file: Path to the YAML file
+        
+    Returns:
+        A dictionary with the "name" and "technology" values; a field
+        missing from the file is None
+        
+    Raises:
+        yaml.YAMLError: If the file is not valid YAML
+    """
+    yaml_file = os.fspath(yaml_file)
+    try:
+        header = _scan_design_header(yaml_file)
+    except yaml.YAMLError:
+        header = None
+    if header is not None:
+        return header
+    
+    # The full parse raises the error, if any, for the whole file
+    yaml_data = read_yaml(yaml_file)
+    if not isinstance(yaml_data, dict):
+        return dict.fromkeys(_HEADER_FIELDS)
+    return {field: yaml_data.get(field) for field in _HEADER_FIELDS}
+
+
+def _scan_design_header(yaml_file: str) -> Optional[Dict[str, Any]]:
+    """Scan the YAML events of a file for the fields of peek_design_header().
+    
+    Args:
+        yaml_file: Path to the YAML file
+        
+    Returns:
+        The header fields, or None if the file needs a full parse
+    """
+    header: Dict[str, Any] = {}
+    resolver = yaml.resolver.Resolver()
+    constructor = yaml.constructor.SafeConstructor()
+    depth = 0
+    key = None
+    
+    with open(yaml_file, "rb") as f:
+        for event in yaml.parse(f, Loader=_Loader):
+            if isinstance(event, yaml.CollectionStartEvent):
+                if depth == 0 and not isinstance(event, yaml.MappingStartEvent):
+                    # Not a mapping
+                    return None
+                if depth == 1 and key is None:
+                    # A complex key
+                    return None
+                depth += 1
+            elif isinstance(event, yaml.CollectionEndEvent):
+                depth -= 1
+                if depth == 1:
+                    # A collection value of the top-level mapping ended
+                    key = None
+                elif depth == 0:
+                    break
+            elif depth == 1 and isinstance(event, yaml.AliasEvent):
+                # An aliased key, or the value of a wanted key, is only
+                # known after constructing its anchor
+                if key is None or key in _HEADER_FIELDS:
+                    return None
+                key = None
+            elif depth == 1 and isinstance(event, yaml.ScalarEvent):
+                # Top-level scalars alternate between keys and values
+                if key is None:
+                    if event.value == "<<" and event.implicit[0]:
+                        # A merge key may supply the fields
+                        return None
+                    key = event.value
+                    continue
+                if key in _HEADER_FIELDS:
+                    tag = event.tag
+                    if tag is None or tag == "!":
+                        tag = resolver.resolve(yaml.ScalarNode, event.value, event.implicit)
+                    node = yaml.ScalarNode(tag, event.value, style=event.style)
+                    header[key] = constructor.construct_object(node)
+                    if len(header) == len(_HEADER_FIELDS):
+                        break
+                key = None
+            elif depth == 0 and isinstance(event, (yaml.ScalarEvent, yaml.AliasEvent)):
+                # Not a mapping
+                return None
+    
+    return {field: header.get(field) for field in _HEADER_FIELDS}
+
+
+@functools.lru_cache(maxsize=64)
+def _load_design_file(path: str, mtime_ns: int, size: int) -> Design:
+    """Parse a design file; cached by load_design().
+    
+    Args:
+        path: Absolute path to the YAML file
+        mtime_ns: Modification time of the file, part of the cache key
+        size: Size of the file, part of the cache key
+        
+    Returns:
+        The parsed Design, shared between cache hits
+    """
+    # Formatted only when debug logging is enabled
+    logger.debug("Loading design from %s", path)
+    
+    # The size comes from the stat() done by load_design()
+    buffering = _LARGE_FILE_BUFFER if size >= _LARGE_FILE_SIZE else -1
+    yaml_data = read_yaml(path, buffering=buffering)
+    
+    return load_design_from_dict(yaml_data)
+
+
+load_design.cache_clear = _load_design_file.cache_clear
+
+
+def load_design_from_dict(yaml_data: Dict[str, Any], strict: bool = False) -> Design:
+    """Load a design from already parsed YAML data.
+    
+    Args:
+        yaml_data: The YAML data as a dictionary
+        strict: Whether to reject data that fails the schema check instead
+            of falling back to the defaults for missing design fields
+        
     Returns:
         A Design object
+        
+    Raises:
+        ValueError: If the PDK is unknown, or if strict is set and the data
+            fails the schema check
     """
-    print(f"Loading design from {yaml_file}...")
-    with open(yaml_file, "r") as f:
-        yaml_data = yaml.safe_load(f)
+    # Look the PDK up first, so an unknown PDK fails before the components
+    # are parsed; malformed values are left to the parser to report
+    technology = yaml_data.get("technology", "generic") if isinstance(yaml_data, dict) else None
+    pdk = get_pdk(technology) if isinstance(technology, str) else None
     
-    design = parse_yaml_to_design(yaml_data)
+    design = parse_yaml_to_design(yaml_data, strict=strict)
     
     # Initialize the PDK
+    if pdk is not None:
+        design._pdk = pdk
     _ = design.pdk
     
     return design
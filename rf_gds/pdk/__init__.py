@@ -1,9 +1,8 @@
 """Process Design Kit (PDK) support for RF GDS Library."""
 
 from rf_gds.pdk.base import PDK, register_pdk, get_pdk
-from rf_gds.pdk.generic import GenericPDK
 
-# Register the generic PDK
-register_pdk(GenericPDK)
+# Importing the module registers the generic PDK
+from rf_gds.pdk.generic import GenericPDK
 
 __all__ = ["PDK", "register_pdk", "get_pdk", "GenericPDK"]
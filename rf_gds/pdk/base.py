@@ -1,29 +1,53 @@
-"""Base PDK class for RF GDS Library."""
+"""Base PDK class for RF GDS Library.
 
+PDKs hold static, read-only tables, so they are plain dataclasses; pydantic
+is kept for the design and component models built from YAML, which need
+its coercion and validation.
+"""
+
+from dataclasses import dataclass, field
 from typing import Dict, Any, List, Tuple, Optional, Type, ClassVar, Union
-from pydantic import BaseModel, Field
 
 
-class Layer(BaseModel):
+@dataclass(frozen=True)
+class Layer:
     """Represents a layer in a PDK."""
     
     name: str
     layer: int
     datatype: int = 0
     description: str = ""
+    # (layer, datatype), built once since layers are frozen
+    _tuple: Tuple[int, int] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        """Build the (layer, datatype) tuple returned by as_tuple()."""
+        object.__setattr__(self, "_tuple", (self.layer, self.datatype))
     
     def as_tuple(self) -> Tuple[int, int]:
         """Return the layer as a tuple (layer, datatype)."""
-        return (self.layer, self.datatype)
+        return self._tuple
 
 
-class PDK(BaseModel):
-    """Base class for Process Design Kits (PDKs)."""
+@dataclass
+class PDK:
+    """Base class for Process Design Kits (PDKs).
+    
+    Layer names are resolved through a name -> (layer, datatype) table
+    built when the PDK is created. Layers added to ``layers`` later are
+    picked up on their first lookup; to change an existing layer, create a
+    new PDK.
+    """
     
     name: ClassVar[str]
     description: str = ""
-    layers: Dict[str, Layer] = Field(default_factory=dict)
-    design_rules: Dict[str, Any] = Field(default_factory=dict)
+    layers: Dict[str, Layer] = field(default_factory=dict)
+    design_rules: Dict[str, Any] = field(default_factory=dict)
+    _layer_tuples: Dict[str, Tuple[int, int]] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        """Build the layer name lookup table."""
+        self._layer_tuples = {name: layer._tuple for name, layer in self.layers.items()}
     
     def get_layer(self, layer_name: str) -> Tuple[int, int]:
         """Get a layer by name.
@@ -37,9 +61,13 @@ class PDK(BaseModel):
         Raises:
             KeyError: If the layer is not found
         """
-        if layer_name not in self.layers:
-            raise KeyError(f"Layer {layer_name} not found in PDK {self.name}")
-        return self.layers[layer_name].as_tuple()
+        layer_tuple = self._layer_tuples.get(layer_name)
+        if layer_tuple is None:
+            layer = self.layers.get(layer_name)
+            if layer is None:
+                raise KeyError(f"Layer {layer_name} not found in PDK {self.name}")
+            layer_tuple = self._layer_tuples[layer_name] = layer._tuple
+        return layer_tuple
     
     def get_design_rule(self, rule_name: str) -> Any:
         """Get a design rule by name.
@@ -61,10 +89,15 @@ class PDK(BaseModel):
 # Registry of PDKs
 _pdk_registry: Dict[str, Type[PDK]] = {}
 
+# PDK instances returned by get_pdk, created when the PDK is registered
+_pdk_instances: Dict[str, PDK] = {}
+
 
 def register_pdk(cls: Type[PDK]) -> Type[PDK]:
     """Register a PDK.
     
+    The PDK is instantiated here, once, and get_pdk() returns that instance.
+    
     Args:
         cls: The PDK class to register
         
@@ -72,21 +105,30 @@ def register_pdk(cls: Type[PDK]) -> Type[PDK]:
         The PDK class
     """
     _pdk_registry[cls.name] = cls
+    _pdk_instances[cls.name] = cls()
     return cls
 
 
 def get_pdk(pdk_name: str) -> PDK:
     """Get a PDK by name.
     
+    Returns the instance created by register_pdk(), shared by all callers
+    and the designs using it. If the instance cache was cleared, the PDK
+    is instantiated again on first use.
+    
     Args:
         pdk_name: The name of the PDK
         
     Returns:
-        An instance of the PDK
+        The shared instance of the PDK
         
     Raises:
         ValueError: If the PDK is not registered
     """
-    if pdk_name not in _pdk_registry:
-        raise ValueError(f"Unknown PDK: {pdk_name}")
-    return _pdk_registry[pdk_name]()
+    try:
+        return _pdk_instances[pdk_name]
+    except KeyError:
+        if pdk_name not in _pdk_registry:
+            raise ValueError(f"Unknown PDK: {pdk_name}") from None
+    pdk = _pdk_instances[pdk_name] = _pdk_registry[pdk_name]()
+    return pdk
@@ -3,23 +3,73 @@
 from typing import Dict, Any, List, Tuple, Optional, Type, cast
 
 import yaml
-from pydantic import ValidationError
+from pydantic import BaseModel, TypeAdapter, ValidationError
 
 from rf_gds.components import Component
-from rf_gds.components.base import get_component_class
+from rf_gds.components.base import Connection, get_component_class
 
+# Validator for the connection list of a component, built once; validating
+# the list in one call is faster than constructing each Connection, even
+# with model_construct()
+_CONNECTIONS_ADAPTER = TypeAdapter(List[Connection])
 
-def parse_yaml_to_design(yaml_data: Dict[str, Any]) -> "Design":
+# Fields of the Component base class, which the entries of ``parameters``
+# must not set
+_RESERVED_PARAMETERS = frozenset(Component.model_fields)
+
+
+def parse_yaml_to_design(yaml_data: Dict[str, Any], strict: bool = False) -> "Design":
     """Parse YAML data into a Design object.
     
+    The data is checked with validate_yaml_schema() once, up front. Data
+    that passes is known to hold every field the design model requires, so
+    the design is built with model_construct() instead of being validated
+    again. Other data is rejected in strict mode, and otherwise validated in
+    full, which applies the defaults for missing design fields and reports
+    errors as before.
+    
     Args:
         yaml_data: The YAML data as a dictionary
+        strict: Whether to reject data that fails the schema check
         
     Returns:
         A Design object
+        
+    Raises:
+        ValueError: If strict is set and the data fails the schema check, or
+            if a component cannot be parsed
     """
     from rf_gds.core import Design
     
+    errors = validate_yaml_schema(yaml_data)
+    if errors and strict:
+        raise ValueError("Invalid design:\n" + "\n".join(f"  - {error}" for error in errors))
+    checked = not errors
+    
+    # Parse components, with the names used per component bound locally
+    components_data = yaml_data.get("components", [])
+    parse = parse_component
+    
+    # Add the name of the failing component to the error
+    def build(comp_data: Dict[str, Any]) -> Component:
+        try:
+            return parse(comp_data)
+        except ValidationError as e:
+            raise ValueError(f"Error parsing component {comp_data.get('name', 'unknown')}: {e}")
+        except KeyError as e:
+            raise ValueError(f"Missing required field in component {comp_data.get('name', 'unknown')}: {e}")
+    
+    components = [build(comp_data) for comp_data in components_data]
+    
+    if checked:
+        return Design.model_construct(
+            name=yaml_data["name"],
+            technology=yaml_data["technology"],
+            units=yaml_data.get("units", "um"),
+            components=components,
+            metadata=yaml_data.get("metadata", {}),
+        )
+    
     # Extract top-level design information
     design_data = {
         "name": yaml_data.get("name", "unnamed_design"),
@@ -30,20 +80,6 @@ def parse_yaml_to_design(yaml_data: Dict[str, Any]) -> "Design":
     
     # Create empty design
     design = Design(**design_data)
-    
-    # Parse components
-    components_data = yaml_data.get("components", [])
-    components = []
-    
-    for comp_data in components_data:
-        try:
-            component = parse_component(comp_data)
-            components.append(component)
-        except ValidationError as e:
-            raise ValueError(f"Error parsing component {comp_data.get('name', 'unknown')}: {e}")
-        except KeyError as e:
-            raise ValueError(f"Missing required field in component {comp_data.get('name', 'unknown')}: {e}")
-    
     design.components = components
     return design
 
@@ -51,80 +87,161 @@ def parse_yaml_to_design(yaml_data: Dict[str, Any]) -> "Design":
 def parse_component(component_data: Dict[str, Any]) -> Component:
     """Parse a component from YAML data.
     
+    The entries of ``parameters`` are passed to the component class as its
+    fields, e.g. ``parameters: {length: 100}`` sets ``length``, and the
+    mapping itself is kept as the ``parameters`` field. They are always
+    validated, since their schema depends on the component type. The base
+    fields (name, parameters, position, rotation, ports and connections)
+    are set from the top-level keys of the component only. The connections
+    are validated as one list.
+    
     Args:
         component_data: The component data as a dictionary
         
     Returns:
         A Component object
+        
+    Raises:
+        KeyError: If the component has no type
+        ValueError: If a parameter has the name of a base field
     """
+    get = component_data.get
+    
     # Get the component type
-    component_type = component_data.get("type")
+    component_type = get("type")
     if not component_type:
         raise KeyError("type")
     
     # Get the component class
     component_class = get_component_class(component_type)
     
-    # Extract position and rotation
-    position = component_data.get("position", (0, 0))
-    rotation = component_data.get("rotation", 0)
-    
     # Extract parameters
-    parameters = component_data.get("parameters", {})
-    
-    # Extract connections
-    connections_data = component_data.get("connections", [])
+    parameters = get("parameters", {})
+    reserved = _RESERVED_PARAMETERS.intersection(parameters)
+    if reserved:
+        raise ValueError(
+            f"Invalid parameters in component {get('name', 'unknown')}: "
+            f"{', '.join(sorted(reserved))} must be given outside of parameters"
+        )
     
     # Create the component
-    component = component_class(
-        name=component_data.get("name", f"{component_type}_unnamed"),
-        parameters=parameters,
-        position=position,
-        rotation=rotation,
-    )
+    component = component_class(**{
+        **parameters,
+        "name": get("name", f"{component_type}_unnamed"),
+        "parameters": parameters,
+        "position": get("position", (0, 0)),
+        "rotation": get("rotation", 0),
+    })
     
     # Add connections
-    for conn_data in connections_data:
-        component.add_connection(
-            port=conn_data.get("port"),
-            target=conn_data.get("target"),
-            target_port=conn_data.get("target_port"),
-        )
+    component.connections = _CONNECTIONS_ADAPTER.validate_python(get("connections", []))
     
     return component
 
 
+class _ConnectionSchema(BaseModel):
+    """Schema of a connection in a design file."""
+    
+    port: str
+    target: str
+    target_port: str
+
+
+class _ComponentSchema(BaseModel):
+    """Schema of a component in a design file.
+    
+    The fields in ``parameters`` depend on the component type, and are
+    validated by the component class itself.
+    """
+    
+    name: str
+    type: str
+    parameters: Dict[str, Any] = {}
+    position: Optional[Tuple[float, float]] = None
+    rotation: float = 0
+    connections: List[_ConnectionSchema] = []
+
+
+class _DesignSchema(BaseModel):
+    """Schema of a design file.
+    
+    Data that passes is used to build the design without validation (see
+    parse_yaml_to_design), so every design field is checked here.
+    """
+    
+    name: str
+    technology: str
+    units: str = "um"
+    components: List[_ComponentSchema]
+    metadata: Dict[str, Any] = {}
+
+
+# Messages for errors of a whole field, by field and error type
+_FIELD_MESSAGES = {
+    ("components", "list_type"): "Components must be a list",
+    ("connections", "list_type"): "Connections must be a list",
+    ("position", "tuple_type"): "Position must be a tuple of (x, y)",
+    ("position", "too_short"): "Position must be a tuple of (x, y)",
+    ("position", "too_long"): "Position must be a tuple of (x, y)",
+}
+
+
+def _format_errors(error: ValidationError) -> List[str]:
+    """Format the errors of a schema ValidationError as messages.
+    
+    Args:
+        error: The ValidationError raised by a schema model
+        
+    Returns:
+        One message per error, prefixed with the component and connection
+        it was found in
+    """
+    messages = []
+    for err in error.errors():
+        loc = list(err["loc"])
+        prefix = ""
+        item = "Design"
+        for label in ("components", "connections"):
+            if len(loc) >= 2 and loc[0] == label and isinstance(loc[1], int):
+                item = f"{label[:-1].capitalize()} {loc[1]}"
+                prefix += f"{item}: "
+                loc = loc[2:]
+        if loc[:1] == ["position"] and len(loc) == 2 and err["type"] == "missing":
+            # A missing coordinate
+            message = _FIELD_MESSAGES["position", "too_short"]
+        elif len(loc) == 1 and (loc[0], err["type"]) in _FIELD_MESSAGES:
+            message = _FIELD_MESSAGES[loc[0], err["type"]]
+        elif err["type"] == "missing" and loc and isinstance(loc[-1], str):
+            message = f"Missing required field: {'.'.join(map(str, loc))}"
+        elif err["type"] == "model_type":
+            # The schema model names mean nothing to the user
+            prefix = prefix[:-len(item) - 2]
+            message = f"{item} must be a dictionary"
+        elif loc:
+            message = f"{'.'.join(map(str, loc))}: {err['msg']}"
+        else:
+            message = err["msg"]
+        messages.append(prefix + message)
+    return messages
+
+
 def validate_yaml_schema(yaml_data: Dict[str, Any]) -> List[str]:
     """Validate YAML data against the schema.
     
+    The whole document is checked in one call of the compiled schema
+    validator.
+    
     Args:
         yaml_data: The YAML data as a dictionary
         
     Returns:
         A list of validation errors, empty if valid
     """
-    errors = []
-    
-    # Validate top-level fields
-    required_fields = ["name", "technology"]
-    for field in required_fields:
-        if field not in yaml_data:
-            errors.append(f"Missing required field: {field}")
-    
-    # Validate components
-    if "components" not in yaml_data:
-        errors.append("Missing required field: components")
-    else:
-        components = yaml_data["components"]
-        if not isinstance(components, list):
-            errors.append("Components must be a list")
-        else:
-            for i, component in enumerate(components):
-                component_errors = validate_component(component)
-                for error in component_errors:
-                    errors.append(f"Component {i}: {error}")
-    
-    return errors
+    try:
+        _DesignSchema.model_validate(yaml_data)
+    except ValidationError as e:
+        return _format_errors(e)
+    return []
 
 
 def validate_component(component_data: Dict[str, Any]) -> List[str]:
@@ -136,33 +253,8 @@ def validate_component(component_data: Dict[str, Any]) -> List[str]:
     Returns:
         A list of validation errors, empty if valid
     """
-    errors = []
-    
-    # Validate required fields
-    required_fields = ["name", "type"]
-    for field in required_fields:
-        if field not in component_data:
-            errors.append(f"Missing required field: {field}")
-    
-    # Validate position
-    if "position" in component_data:
-        position = component_data["position"]
-        if not isinstance(position, (list, tuple)) or len(position) != 2:
-            errors.append("Position must be a tuple of (x, y)")
-    
-    # Validate connections
-    if "connections" in component_data:
-        connections = component_data["connections"]
-        if not isinstance(connections, list):
-            errors.append("Connections must be a list")
-        else:
-            for i, connection in enumerate(connections):
-                if not isinstance(connection, dict):
-                    errors.append(f"Connection {i} must be a dictionary")
-                else:
-                    required_conn_fields = ["port", "target", "target_port"]
-                    for field in required_conn_fields:
-                        if field not in connection:
-                            errors.append(f"Connection {i}: Missing required field: {field}")
-    
-    return errors
+    try:
+        _ComponentSchema.model_validate(component_data)
+    except ValidationError as e:
+        return _format_errors(e)
+    return []
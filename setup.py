@@ -14,6 +14,10 @@ setup(
         "pydantic>=2.0.0",
     ],
     extras_require={
+        "fast": [
+            "orjson>=3.0.0",
+            "numba>=0.57.0",
+        ],
         "dev": [
             "pytest>=7.0.0",
             "black>=23.0.0",
@@ -2,6 +2,7 @@
 
 import os
 import sys
+import inspect
 import pytest
 
 # Add the parent directory to the path to import rf_gds
@@ -161,3 +162,505 @@ def test_yaml_parsing():
     # Check that the GDS component was created
     assert gds is not None
     assert gds.name == "example_rf_design"
+
+
+def test_design_gds_cache(tmp_path):
+    """Test that cached component GDS files are reused."""
+    def make_design():
+        return rf_gds.Design(
+            name="cached_design",
+            technology="generic",
+            components=[
+                MicrostripLine(name="cached_line", length=100, width=10, layer=(1, 0)),
+            ],
+        )
+    
+    # The first conversion populates the cache
+    design = make_design()
+    design.to_gds(cache_dir=tmp_path)
+    assert len(list(tmp_path.glob("*.gds"))) == 1
+    # Only the GDS and metadata files are left, no temporary files
+    assert sorted(path.suffix for path in tmp_path.iterdir()) == [".gds", ".yml"]
+    
+    # The second conversion reads the cached GDS and restores the ports
+    cached = make_design()
+    gds = cached.to_gds(cache_dir=tmp_path)
+    assert gds is not None
+    assert len(list(tmp_path.glob("*.gds"))) == 1
+    assert cached.components[0].ports == design.components[0].ports
+
+
+def test_design_parallel_to_gds():
+    """Test building the components of a design in worker processes."""
+    design = rf_gds.Design(
+        name="parallel_design",
+        technology="generic",
+        components=[
+            MicrostripLine(name="parallel_line", length=100, width=10, layer=(1, 0)),
+            CPWLine(name="parallel_cpw", length=100, width=10, gap=5, layer=(1, 0),
+                    position=(200, 0)),
+        ],
+    )
+    
+    gds = design.to_gds(jobs=2)
+    
+    # Check that the references were added in design order
+    assert [ref.parent.name for ref in gds.references] == ["parallel_line", "parallel_cpw"]
+    
+    # Check that the ports built in the workers were copied back
+    assert "out" in design.components[0].ports
+    assert design.components[1].ports["out"].position[0] == 100
+
+
+def test_duplicate_cell_names():
+    """Test that same-named cells with different geometry are rejected."""
+    import gdsfactory as gf
+    from rf_gds.core import _check_duplicate_cells
+    
+    def make_design():
+        return rf_gds.Design(
+            name="duplicate_design",
+            technology="generic",
+            components=[
+                MicrostripLine(name="line", length=100, width=10),
+                MicrostripLine(name="line", length=200, width=10, position=(0, 50)),
+            ],
+        )
+    
+    # Workers name their cells independently, so names must be unique
+    with pytest.raises(ValueError, match="unique to build in parallel: line"):
+        make_design().to_gds(jobs=2)
+    
+    # Identical copies of a cell, as read back from the cache, are kept once
+    top = gf.Component()
+    cells = []
+    for length in (100, 100, 200):
+        cell = gf.Component()
+        cell.add_polygon([(0, 0), (length, 0), (length, 10), (0, 10)], layer=(1, 0))
+        cells.append(cell)
+    for cell in cells:
+        # Bypass gdsfactory's renaming, as for cells from other processes
+        cell._cell.name = "shared_cell"
+    top.add_ref(cells[0])
+    top.add_ref(cells[1])
+    _check_duplicate_cells(top)
+    
+    top.add_ref(cells[2])
+    with pytest.raises(ValueError, match="Different cells are named shared_cell"):
+        _check_duplicate_cells(top)
+
+
+def test_single_component_base_class():
+    """Test that all modules share a single Component base class."""
+    from rf_gds.components.base import Component, _component_registry, get_component_class
+    
+    # Make sure the built-in components are loaded
+    get_component_class("microstrip_line")
+    
+    # Every rf_gds module that exposes a Component refers to the same class
+    classes = {
+        module.Component
+        for name, module in list(sys.modules.items())
+        if name.startswith("rf_gds") and inspect.isclass(getattr(module, "Component", None))
+    }
+    assert classes == {Component}
+    
+    # Every registered component derives from it
+    assert all(issubclass(cls, Component) for cls in _component_registry.values())
+
+
+def test_cached_cell_sharing():
+    """Test that equal components share one geometry cell."""
+    from rf_gds.components.base import _CELL_CACHE, clear_cell_cache
+    
+    clear_cell_cache()
+    first = MicrostripLine(name="shared_a", length=100, width=10, layer=(1, 0)).to_gds()
+    second = MicrostripLine(name="shared_b", length=100, width=10, layer=(1, 0)).to_gds()
+    other = MicrostripLine(name="shared_c", length=120, width=10, layer=(1, 0)).to_gds()
+    
+    # Equal parameters share a cell; different parameters get their own
+    assert first.references[0].parent is second.references[0].parent
+    assert other.references[0].parent is not first.references[0].parent
+    assert other.references[0].parent.name != first.references[0].parent.name
+    assert len(_CELL_CACHE) == 2
+    
+    # The wrappers keep the component names
+    assert (first.name, second.name) == ("shared_a", "shared_b")
+    
+    clear_cell_cache()
+    assert len(_CELL_CACHE) == 0
+
+
+def test_cached_cell_pdk_layers():
+    """Test that PDKs with the same name but different layers do not share cells."""
+    from rf_gds.components.base import clear_cell_cache
+    from rf_gds.pdk import GenericPDK
+    from rf_gds.pdk.base import Layer
+    
+    clear_cell_cache()
+    pdk_a = GenericPDK()
+    pdk_b = GenericPDK(layers={"metal1": Layer(name="metal1", layer=20)})
+    
+    cells = []
+    for pdk in (pdk_a, pdk_b):
+        line = MicrostripLine(name="pdk_line", length=100, width=10, layer="metal1")
+        line.set_pdk(pdk)
+        cells.append(line.to_gds().references[0].parent)
+    
+    assert cells[0] is not cells[1]
+    assert (20, 0) in cells[1].get_polygons(by_spec=True)
+    clear_cell_cache()
+
+
+def test_cached_cell_size_limit(monkeypatch):
+    """Test that the cell cache drops the least recently used cells."""
+    from rf_gds.components import base
+    
+    base.clear_cell_cache()
+    monkeypatch.setattr(base, "CELL_CACHE_SIZE", 2)
+    for length in (10, 20, 10, 30):
+        MicrostripLine(name="lru_line", length=length, width=5).to_gds()
+    
+    # Length 20 was used least recently when length 30 was added
+    cached_params = [key[2] for key in base._CELL_CACHE]
+    assert len(cached_params) == 2
+    assert not any('"length":20.0' in params for params in cached_params)
+    base.clear_cell_cache()
+
+
+def test_port_layer_name_kept(tmp_path):
+    """Test that ports keep a PDK layer name given by the user."""
+    def make_design():
+        return rf_gds.Design(
+            name="layer_name_design",
+            technology="generic",
+            components=[MicrostripLine(name="named_line", length=100, width=10, layer="metal2")],
+        )
+    
+    design = make_design()
+    gds = design.to_gds()
+    
+    # The GDS is drawn on the resolved layer, the model keeps the name
+    assert tuple(gds.references[0].parent.ports["in"].layer) == (2, 0)
+    assert design.components[0].ports["in"].layer == "metal2"
+    assert design.components[0].model_dump()["ports"]["out"]["layer"] == "metal2"
+    
+    # The same holds for components read back from the disk cache
+    make_design().to_gds(cache_dir=tmp_path)
+    cached = make_design()
+    cached.to_gds(cache_dir=tmp_path)
+    assert cached.components[0].ports["out"].layer == "metal2"
+
+
+def _write_design(path, name):
+    """Write a small design file for the load_design tests."""
+    path.write_text(
+        f"name: {name}\n"
+        "technology: generic\n"
+        "components:\n"
+        "  - name: line1\n"
+        "    type: microstrip_line\n"
+        "    parameters: {length: 100, width: 10}\n"
+    )
+
+
+def test_load_design_cache(tmp_path):
+    """Test that load_design reuses unchanged files and reloads changed ones."""
+    from rf_gds.core import _load_design_file
+    
+    path = tmp_path / "design.yaml"
+    _write_design(path, "first")
+    rf_gds.load_design.cache_clear()
+    
+    # The second load is a cache hit, but returns an independent copy that
+    # still shares the PDK instance
+    first = rf_gds.load_design(path)
+    second = rf_gds.load_design(path)
+    assert _load_design_file.cache_info().hits == 1
+    assert first is not second
+    assert first.components[0] is not second.components[0]
+    assert first._pdk is rf_gds.get_pdk("generic")
+    assert second._pdk is rf_gds.get_pdk("generic")
+    
+    # A change of size reloads the file
+    _write_design(path, "second_name")
+    assert rf_gds.load_design(path).name == "second_name"
+    
+    # So does a change of modification time at the same size
+    _write_design(path, "third_name_")
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert rf_gds.load_design(path).name == "third_name_"
+    assert _load_design_file.cache_info().misses == 3
+    rf_gds.load_design.cache_clear()
+
+
+def test_strict_parsing():
+    """Test that strict parsing rejects documents that fail the schema check."""
+    data = {"components": [{"type": "microstrip_line", "parameters": {"length": 10, "width": 2}}]}
+    
+    with pytest.raises(ValueError) as excinfo:
+        rf_gds.load_design_from_dict(data, strict=True)
+    message = str(excinfo.value)
+    assert message.startswith("Invalid design:")
+    assert "  - Missing required field: technology" in message
+    assert "  - Component 0: Missing required field: name" in message
+    
+    # Without strict, the defaults are used for the missing fields
+    design = rf_gds.load_design_from_dict(data)
+    assert (design.name, design.technology) == ("unnamed_design", "generic")
+    
+    # Design fields outside of the components are checked too
+    data = {"name": "d", "technology": "generic", "units": 1, "metadata": None, "components": []}
+    with pytest.raises(ValueError) as excinfo:
+        rf_gds.load_design_from_dict(data, strict=True)
+    message = str(excinfo.value)
+    assert "  - units: Input should be a valid string" in message
+    assert "  - metadata: Input should be a valid dictionary" in message
+
+
+@pytest.mark.parametrize("text, expected", [
+    # Block style, with the fields first
+    ("name: plain\ntechnology: generic\ncomponents: []\n", ("plain", "generic")),
+    # Flow style, with quoted scalars
+    ('{components: [], name: "flow", technology: \'generic\'}\n', ("flow", "generic")),
+    # A field given as an alias is resolved by a full parse
+    ("base: &tech generic\nname: aliased\ntechnology: *tech\n", ("aliased", "generic")),
+    # A merge key may supply the fields
+    ("<<: {name: merged, technology: generic}\ncomponents: []\n", ("merged", "generic")),
+    # Null values and missing fields are None
+    ("name: ~\ntechnology: null\n", (None, None)),
+    ("components: []\n", (None, None)),
+])
+def test_peek_design_header(tmp_path, text, expected):
+    """Test reading the name and technology of a design file."""
+    path = tmp_path / "design.yaml"
+    path.write_text(text)
+    header = rf_gds.peek_design_header(path)
+    assert (header["name"], header["technology"]) == expected
+
+
+def test_component_parameters():
+    """Test that parameters set the component fields, except the base fields."""
+    from rf_gds.yaml_parser import parse_component
+    
+    data = {"name": "line1", "type": "microstrip_line", "parameters": {"length": 100, "width": 10}}
+    line = parse_component(data)
+    assert (line.length, line.width) == (100, 10)
+    assert line.parameters == {"length": 100, "width": 10}
+    
+    data["parameters"] = {"length": 100, "width": 10, "position": [5, 5], "rotation": 90}
+    with pytest.raises(ValueError, match="line1: position, rotation must be given outside"):
+        parse_component(data)
+
+
+def test_schema_errors():
+    """Test the messages of the design schema check."""
+    from rf_gds.yaml_parser import validate_yaml_schema
+    
+    assert validate_yaml_schema(["not", "a", "mapping"]) == ["Design must be a dictionary"]
+    assert validate_yaml_schema({"name": "d", "technology": "generic", "components": {}}) == [
+        "Components must be a list"
+    ]
+    
+    components = [
+        "line",
+        {"name": 1, "type": "microstrip_line", "parameters": [100]},
+        {"name": "a", "type": "microstrip_line", "position": [0], "rotation": "left"},
+        {"name": "b", "type": "microstrip_line", "position": ["x", 0], "connections": {}},
+        {"name": "c", "type": "microstrip_line", "connections": ["port1", {"port": "port1"}]},
+    ]
+    errors = validate_yaml_schema({"name": "d", "technology": "generic", "components": components})
+    assert errors == [
+        "Component 0 must be a dictionary",
+        "Component 1: name: Input should be a valid string",
+        "Component 1: parameters: Input should be a valid dictionary",
+        "Component 2: Position must be a tuple of (x, y)",
+        "Component 2: rotation: Input should be a valid number, unable to parse string as a number",
+        "Component 3: position.0: Input should be a valid number, unable to parse string as a number",
+        "Component 3: Connections must be a list",
+        "Component 4: Connection 0 must be a dictionary",
+        "Component 4: Connection 1: Missing required field: target",
+        "Component 4: Connection 1: Missing required field: target_port",
+    ]
+
+
+def _run_cli(monkeypatch, *args):
+    """Run the rf-gds command line with the given arguments."""
+    from rf_gds import cli
+    
+    monkeypatch.setattr(sys, "argv", ["rf-gds", *map(str, args)])
+    cli.main()
+
+
+def test_cli_convert_gzip_jobs(tmp_path, monkeypatch):
+    """Test that parallel, gzip-compressed output matches the plain output."""
+    import gzip
+    import gdstk
+    
+    path = tmp_path / "design.yaml"
+    _write_design(path, "cli_design")
+    plain = tmp_path / "plain.gds"
+    compressed = tmp_path / "compressed.gds.gz"
+    
+    _run_cli(monkeypatch, "convert", path, "-o", plain)
+    _run_cli(monkeypatch, "convert", path, "-o", compressed, "--jobs", 2)
+    
+    decompressed = tmp_path / "decompressed.gds"
+    with gzip.open(compressed, "rb") as f:
+        decompressed.write_bytes(f.read())
+    
+    # Cell names carry gdsfactory's global counters, so compare the polygons
+    def polygons(gds_path):
+        (top,) = gdstk.read_gds(str(gds_path)).top_level()
+        return sorted(
+            (polygon.layer, polygon.datatype, polygon.points.round(3).tolist())
+            for polygon in top.get_polygons()
+        )
+    
+    expected = polygons(plain)
+    assert expected
+    assert polygons(decompressed) == expected
+
+
+def test_cli_write_gds_without_fifo(tmp_path, monkeypatch):
+    """Test that compressed output falls back to a temporary file without named pipes."""
+    import gzip
+    from rf_gds import cli
+    
+    gds = MicrostripLine(name="gzip_line", length=100, width=10).to_gds()
+    plain = tmp_path / "plain.gds"
+    cli.write_gds(gds, plain)
+    
+    monkeypatch.delattr(os, "mkfifo", raising=False)
+    compressed = tmp_path / "compressed.gds.gz"
+    cli.write_gds(gds, compressed)
+    with gzip.open(compressed, "rb") as f:
+        assert f.read() == plain.read_bytes()
+
+
+def test_cli_convert_validate(tmp_path, monkeypatch):
+    """Test that --validate rejects designs that fail the schema check."""
+    path = tmp_path / "design.yaml"
+    path.write_text(
+        "name: no_technology\n"
+        "components:\n"
+        "  - name: line1\n"
+        "    type: microstrip_line\n"
+        "    parameters: {length: 100, width: 10}\n"
+    )
+    
+    with pytest.raises(SystemExit) as excinfo:
+        _run_cli(monkeypatch, "convert", path, "-o", tmp_path / "strict.gds", "--validate")
+    assert excinfo.value.code == 1
+    assert not (tmp_path / "strict.gds").exists()
+    
+    # Without --validate, the default technology is used
+    _run_cli(monkeypatch, "convert", path, "-o", tmp_path / "default.gds")
+    assert (tmp_path / "default.gds").exists()
+
+
+def test_arc_point_count():
+    """Test that arcs are tessellated within the chord error tolerance."""
+    import math
+    from rf_gds import _geom_kernels
+    
+    radius, angle = 100.0, 90.0
+    counts = [_geom_kernels.arc_point_count(radius, angle, tolerance) for tolerance in (0.1, 0.01, 0.001)]
+    assert counts[0] < counts[1] < counts[2]
+    
+    for tolerance, n_points in zip((0.1, 0.01, 0.001), counts):
+        step = math.radians(angle) / (n_points - 1)
+        assert radius * (1 - math.cos(step / 2)) <= tolerance
+
+
+@pytest.mark.parametrize("inner_radius, spacing, n_turns, tolerances", [
+    (20.0, 10.0, 3.5, (0.1, 0.01, 0.001)),
+    # The curvature radius at the centre, spacing / (4 * pi), is below the
+    # larger tolerances
+    (0.0, 10.0, 10, (2.0, 1.0, 0.05)),
+])
+def test_spiral_point_count(inner_radius, spacing, n_turns, tolerances):
+    """Test that spirals are tessellated within the chord error tolerance."""
+    import numpy as np
+    from rf_gds import _geom_kernels
+    
+    counts = [
+        _geom_kernels.spiral_point_count(inner_radius, spacing, n_turns, tolerance)
+        for tolerance in tolerances
+    ]
+    assert counts[0] < counts[1] < counts[2]
+    
+    def spiral(theta):
+        r = inner_radius + spacing * theta / (2 * np.pi)
+        return np.stack([r * np.cos(theta), r * np.sin(theta)], axis=-1)
+    
+    for tolerance, n_points in zip(tolerances, counts):
+        theta = np.linspace(0, 2 * np.pi * n_turns, n_points)
+        points = spiral(theta)
+        chords = points[1:] - points[:-1]
+        # Distance from points of the spiral between the chord ends to the chord
+        sagitta = 0.0
+        for u in np.linspace(0, 1, 11)[1:-1]:
+            offsets = spiral(theta[:-1] + u * (theta[1:] - theta[:-1])) - points[:-1]
+            cross = chords[:, 0] * offsets[:, 1] - chords[:, 1] * offsets[:, 0]
+            sagitta = max(sagitta, (np.abs(cross) / np.linalg.norm(chords, axis=1)).max())
+        assert sagitta <= tolerance
+
+
+@pytest.mark.parametrize("component_type, parameters", [
+    ("microstrip_line", {"length": 100, "width": 10}),
+    ("tapered_microstrip_line", {"length": 100, "width_in": 5, "width_out": 15}),
+    ("curved_microstrip_line", {"radius": 50, "width": 10, "angle": 90}),
+    ("cpw_line", {"length": 100, "width": 10, "gap": 5}),
+    ("cpw_bend", {"radius": 50, "width": 10, "gap": 5}),
+    ("cpw_taper", {"length": 100, "width_in": 5, "width_out": 15, "gap_in": 3, "gap_out": 8}),
+])
+def test_parse_transmission_lines(component_type, parameters):
+    """Test that each transmission line type parses with only its own dimensions."""
+    from rf_gds.yaml_parser import parse_component
+    
+    line = parse_component({"name": "line1", "type": component_type, "parameters": parameters})
+    for key, value in parameters.items():
+        assert getattr(line, key) == value
+    assert set(line.to_gds().ports.keys()) == {"in", "out"}
+
+
+def test_unknown_pdk_fails_first():
+    """Test that an unknown PDK is reported before the components are parsed."""
+    data = {
+        "name": "d",
+        "technology": "no_such_pdk",
+        "components": [{"name": "c", "type": "no_such_component"}],
+    }
+    with pytest.raises(ValueError, match="Unknown PDK: no_such_pdk"):
+        rf_gds.load_design_from_dict(data)
+
+
+def test_port_values_are_floats():
+    """Test that ports built by to_gds() hold the types Port validation gives."""
+    line = MicrostripLine(name="typed_line", length=100, width=10, layer=[1, 0])
+    line.to_gds()
+    port_in = line.ports["in"]
+    assert port_in.position == (0.0, 0.0) and all(type(v) is float for v in port_in.position)
+    assert type(port_in.width) is float
+    assert type(port_in.orientation) is float and port_in.orientation == 180.0
+    assert port_in.layer == (1, 0)
+    assert port_in == rf_gds.components.Port.model_validate(port_in.model_dump())
+
+
+def test_read_yaml_without_libyaml(tmp_path, monkeypatch, caplog):
+    """Test that parsing without libyaml logs an install hint once."""
+    import yaml
+    from rf_gds import core
+    
+    path = tmp_path / "data.yaml"
+    path.write_text("name: d\n")
+    monkeypatch.setattr(core, "_Loader", yaml.SafeLoader)
+    core._warn_no_libyaml.cache_clear()
+    
+    with caplog.at_level("WARNING", logger="rf_gds.core"):
+        assert core.read_yaml(path) == {"name": "d"}
+        assert core.read_yaml(path) == {"name": "d"}
+    assert len([record for record in caplog.records if "libyaml" in record.message]) == 1
+    core._warn_no_libyaml.cache_clear()